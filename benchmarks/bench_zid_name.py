@@ -0,0 +1,205 @@
+"""
+Performance benchmarks for zid_name.
+
+Measures throughput (lines/sec), per-call latency percentiles and peak memory
+of sanitizeName, the [Replacements] step, process_line and process_string on
+synthetic corpora that are generated locally from a fixed seed.
+
+Usage:
+    python benchmarks/bench_zid_name.py --output baseline.json
+    python benchmarks/bench_zid_name.py --compare baseline.json --threshold 0.10
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import Slugifier, compile_replacements
+
+# Fixed settings so results do not depend on the local config.ini
+BENCH_CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': True,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 3,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+        'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+        'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '. ': '-', '.': '-'
+    }
+}
+
+LATIN_WORDS = ("note project meeting summary draft review task idea reading list weekly plan "
+               "research paper chapter version release notes archive backup report").split()
+GERMAN_WORDS = ("Übung Straße Größe Fußball Häuser Schlösser Äpfel Öfen Überraschung "
+                "Nachrichten für Deutschlernende Prüfung Bücher Grüße").split()
+CYRILLIC_WORDS = ("Привет мир заметка проект встреча итоги черновик задача идея чтение "
+                  "список план исследование ёлка Ёж").split()
+
+# Every prefix shape accepted by zidLineRegex
+ZID_PREFIXES = ["", "- ", "* ", "+ ", "1. ", "42. ", "- [ ] ", "- [x] ", "* [X] ", "1. [ ] ",
+                "  - ", "\t* [x] ", "# ", "## ", "### ", "###### "]
+
+EXTENSIONS = [".md", ".pdf", ".tar.gz", ".1.de.srt", ".ytsrv3.srt", ".en.vtt", ".mp4", ".avif"]
+
+def make_zid(rng):
+    return f"20{rng.randint(10, 26):02d}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}" \
+           f"{rng.randint(0, 23):02d}{rng.randint(0, 59):02d}{rng.randint(0, 59):02d}"
+
+def words(rng, vocabulary, count):
+    return " ".join(rng.choice(vocabulary) for _ in range(count))
+
+def build_corpora(lines, seed):
+    """Returns {name: [line, ...]} with `lines` entries per corpus."""
+    rng = random.Random(seed)
+    mixed = LATIN_WORDS + GERMAN_WORDS
+    return {
+        'short_titles': [words(rng, LATIN_WORDS, rng.randint(2, 5)).title() for _ in range(lines)],
+        'long_titles': [". ".join(words(rng, mixed, rng.randint(6, 12)) for _ in range(rng.randint(3, 6))) + "."
+                        for _ in range(lines)],
+        'cyrillic_umlauts': [words(rng, CYRILLIC_WORDS + GERMAN_WORDS, rng.randint(4, 10)) for _ in range(lines)],
+        'zid_tasks': [f"{rng.choice(ZID_PREFIXES)}{make_zid(rng)} {words(rng, mixed, rng.randint(2, 8))}"
+                      if rng.random() < 0.7 else words(rng, mixed, rng.randint(3, 9))
+                      for _ in range(lines)],
+        'deep_extensions': [f"{make_zid(rng)} {words(rng, mixed, rng.randint(2, 9))} - English{rng.choice(EXTENSIONS)}"
+                            for _ in range(lines)],
+    }
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def measure(func, items, repeat):
+    """Runs func over items `repeat` times; returns throughput and latency stats."""
+    perf_counter_ns = time.perf_counter_ns
+    latencies = []
+    best = None
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        for item in items:
+            t0 = perf_counter_ns()
+            func(item)
+            latencies.append(perf_counter_ns() - t0)
+        elapsed = perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    latencies.sort()
+    return {
+        'lines_per_sec': round(len(items) / (best / 1e9), 1),
+        'p50_us': round(percentile(latencies, 0.50) / 1000, 3),
+        'p90_us': round(percentile(latencies, 0.90) / 1000, 3),
+        'p99_us': round(percentile(latencies, 0.99) / 1000, 3),
+    }
+
+def peak_memory(func, items):
+    """Peak traced allocation (bytes) while running func over items once."""
+    tracemalloc.start()
+    try:
+        for item in items:
+            func(item)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run(lines, repeat, seed):
+    slugifier = Slugifier(BENCH_CONFIG)
+    # The single-pass str.translate table, otherwise only used for large maps
+    threshold = zid_name.TRANSLATE_MIN_REPLACEMENTS
+    zid_name.TRANSLATE_MIN_REPLACEMENTS = 0
+    try:
+        translate_table = compile_replacements(BENCH_CONFIG['replacements'])
+    finally:
+        zid_name.TRANSLATE_MIN_REPLACEMENTS = threshold
+    corpora = build_corpora(lines, seed)
+    results = {}
+
+    for name, corpus in corpora.items():
+        batch = "\n".join(corpus)
+        stages = {
+            'sanitizeName': (slugifier.slugify, corpus, len(corpus)),
+            # [Replacements] alone: the ordered loop in use vs. the translate table
+            'replacements': (slugifier.replaceChars, corpus, len(corpus)),
+            'replace_table': (translate_table, corpus, len(corpus)),
+            'process_line': (slugifier.process_line, corpus, len(corpus)),
+            # One call over the whole corpus; throughput is reported per line
+            'process_string': (slugifier.process, [batch], len(corpus)),
+        }
+        results[name] = {}
+        for stage, (func, items, line_count) in stages.items():
+            stats = measure(func, items, repeat)
+            stats['lines_per_sec'] = round(stats['lines_per_sec'] * line_count / len(items), 1)
+            stats['peak_memory_bytes'] = peak_memory(func, items)
+            results[name][stage] = stats
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'lines': lines,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+def compare(current, baseline, threshold):
+    """Returns a list of regressions where throughput fell by more than threshold."""
+    regressions = []
+    for corpus, stages in baseline['results'].items():
+        for stage, old in stages.items():
+            new = current['results'].get(corpus, {}).get(stage)
+            if new is None:
+                continue
+            change = new['lines_per_sec'] / old['lines_per_sec'] - 1
+            if change < -threshold:
+                regressions.append(f"{corpus}/{stage}: {old['lines_per_sec']:.0f} -> "
+                                   f"{new['lines_per_sec']:.0f} lines/sec ({change:+.1%})")
+    return regressions
+
+def print_table(report, stream):
+    print(f"{'corpus':<18} {'stage':<15} {'lines/sec':>12} {'p50 us':>9} {'p99 us':>9} {'peak KiB':>10}", file=stream)
+    for corpus, stages in report['results'].items():
+        for stage, stats in stages.items():
+            print(f"{corpus:<18} {stage:<15} {stats['lines_per_sec']:>12.0f} {stats['p50_us']:>9.2f} "
+                  f"{stats['p99_us']:>9.2f} {stats['peak_memory_bytes'] / 1024:>10.1f}", file=stream)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark zid_name slugification stages.")
+    parser.add_argument("--lines", type=int, default=20000, help="Lines per synthetic corpus (default: 20000).")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage; the best run is reported (default: 3).")
+    parser.add_argument("--seed", type=int, default=20240929, help="Seed for corpus generation.")
+    parser.add_argument("--output", metavar='FILE', help="Write results as JSON to FILE.")
+    parser.add_argument("--compare", metavar='BASELINE', help="Compare against a previous JSON result.")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed throughput drop versus --compare before failing (default: 0.10).")
+    args = parser.parse_args()
+
+    report = run(args.lines, args.repeat, args.seed)
+    print_table(report, sys.stdout)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print("\nRegressions:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} versus {args.compare}.")
+
+if __name__ == "__main__":
+    main()
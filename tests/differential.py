@@ -0,0 +1,217 @@
+"""
+Differential test harness for the slug pipeline.
+
+Generates randomized settings and inputs (umlauts, Cyrillic, other Unicode,
+ZID prefixes, dot-heavy extensions, mixed line endings and whitespace), runs
+them through both the live zid_name and the frozen reference copy in
+zid_name_reference.py, and reports every mismatch as a minimized counterexample.
+Cases are generated per block from the seed, so any run can be reproduced.
+
+Usage:
+    python tests/differential.py --count 1000000 --jobs 0
+    python tests/differential.py --count 20000 --seed 7 --jobs 1
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import zid_name_reference as reference
+from zid_name import Slugifier
+
+# Cases per work item; also the unit a block is reproduced from (seed, block)
+BLOCK_SIZE = 2000
+
+# Mismatches reported per block; the rest are only counted
+MAX_REPORTS_PER_BLOCK = 3
+
+REPLACEMENT_MAPS = [
+    {'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+     'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '. ': '-', '.': '-'},
+    {'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+     'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'},
+    {'.': '-', '. ': '_', '::': '~', ':': ' '},
+    {'a': 'b', 'b': 'c', 'Ё': 'Е', 'Е': 'E'},
+    {'_': '', 'ab': 'Z', ' ': '_'},
+    {},
+]
+
+ALLOWED_CHARS = [r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]', r'[^\w\s-]', r'[^a-z0-9 _.-]']
+
+SEPARATORS = ['-', '-', '_', '', '--', ' ', '.']
+
+WORDS = ("note project Meeting summary draft TASK idea v1.2.3 e.g. Dr. Übung Straße Größe Fußball "
+         "Häuser ÄÖÜ ẞIG Привет мир ёлка Ёж İstanbul ǅemal ﬁle naïve café 日本語 😀 a b c ab abc").split()
+
+PREFIXES = ["", "", "- ", "* ", "+ ", "1. ", "42. ", "- [ ] ", "- [x] ", "* [X] ", "1. [ ] ",
+            "  - ", "\t* [x] ", "# ", "## ", "###### ", "####### ", "-", "-  [ ]  ", "   "]
+
+EXTENSIONS = [".md", ".pdf", ".tar.gz", ".1.de.srt", ".ytsrv3.srt", ".en.vtt", ".MP4", ". txt", "..", ".", ".a b"]
+
+SPACES = [" ", " ", " ", "  ", "\t", " ", " ", "\x0b", "\x0c", "\x1c", "\x85", " "]
+
+PUNCTUATION = [".", ". ", "..", ":", "_", "-", "--", "(", ")", "!", "?", ",", "'", "/", "\\"]
+
+LINE_ENDINGS = ["\n", "\n", "\r\n", "\r", "\n\n", "\r\n\r\n"]
+
+def random_settings(rng):
+    return {
+        'slug_word_count': rng.choice([1, 2, 3, 4, 4, 6, 10]),
+        'process_non_zid_lines': rng.random() < 0.5,
+        'preserve_extension_depth': rng.choice([0, 0, 0, 1, 2, 3]),
+        'slugify_extension_depth': rng.choice([0, 0, 1, 3]),
+        'allowed_chars_regex': rng.choice(ALLOWED_CHARS),
+        'lowercase': rng.random() < 0.8,
+        'separator': rng.choice(SEPARATORS),
+        'replacements': rng.choice(REPLACEMENT_MAPS),
+    }
+
+def make_zid(rng):
+    digits = rng.choice([14, 14, 14, 13, 15])
+    return "".join(rng.choice("0123456789") for _ in range(digits))
+
+def random_title(rng):
+    parts = []
+    for _ in range(rng.randint(0, 8)):
+        roll = rng.random()
+        if roll < 0.55:
+            parts.append(rng.choice(WORDS))
+        elif roll < 0.75:
+            parts.append(rng.choice(PUNCTUATION))
+        elif roll < 0.8:
+            parts.append(chr(rng.randint(0x20, 0x2FFF)))
+        parts.append(rng.choice(SPACES) if rng.random() < 0.8 else "")
+    if rng.random() < 0.4:
+        parts.append(rng.choice(EXTENSIONS))
+    return "".join(parts)
+
+def random_line(rng):
+    zid = make_zid(rng) + rng.choice([" ", " ", "  ", "\t", ""]) if rng.random() < 0.5 else ""
+    return rng.choice(PREFIXES) + zid + random_title(rng)
+
+def random_batch(rng):
+    text = "".join(random_line(rng) + rng.choice(LINE_ENDINGS) for _ in range(rng.randint(1, 6)))
+    return text if rng.random() < 0.5 else text.rstrip("\r\n")
+
+def generate_case(rng):
+    """Returns (operation, settings, text) for one randomized case."""
+    settings = random_settings(rng)
+    roll = rng.random()
+    if roll < 0.35:
+        return 'sanitizeName', settings, random_title(rng)
+    if roll < 0.7:
+        return 'process_line', settings, random_line(rng)
+    return 'process_string', settings, random_batch(rng)
+
+def run_live(operation, settings, text):
+    slugifier = Slugifier(settings)
+    if operation == 'sanitizeName':
+        return slugifier.slugify(text)
+    if operation == 'process_line':
+        return slugifier.process_line(text)
+    return slugifier.process(text)
+
+def run_reference(operation, settings, text):
+    if operation == 'sanitizeName':
+        return reference.sanitizeName(text, settings)
+    if operation == 'process_line':
+        return reference.process_line(text, settings)
+    return reference.process_string(text, settings)
+
+def outcome(func, operation, settings, text):
+    # Exceptions are part of the behavior being compared
+    try:
+        return func(operation, settings, text)
+    except Exception as e:
+        return f"<{type(e).__name__}>"
+
+def mismatch(operation, settings, text):
+    return outcome(run_live, operation, settings, text) != outcome(run_reference, operation, settings, text)
+
+def minimize(operation, settings, text):
+    """
+    Shrinks a failing input: removes ever smaller chunks of characters while
+    the live and reference results still differ (delta debugging).
+    """
+    chunk = max(1, len(text) // 2)
+    while True:
+        start = 0
+        while start < len(text):
+            candidate = text[:start] + text[start + chunk:]
+            if candidate != text and mismatch(operation, settings, candidate):
+                text = candidate
+            else:
+                start += chunk
+        if chunk == 1:
+            return text
+        chunk //= 2
+
+def run_block(seed, block, count=BLOCK_SIZE):
+    """Runs one block of cases; returns (cases, mismatches, minimized reports)."""
+    rng = random.Random(f"{seed}:{block}")
+    failures = 0
+    reports = []
+    for index in range(count):
+        operation, settings, text = generate_case(rng)
+        if not mismatch(operation, settings, text):
+            continue
+        failures += 1
+        if len(reports) < MAX_REPORTS_PER_BLOCK:
+            small = minimize(operation, settings, text)
+            reports.append({
+                'case': f"{seed}:{block}:{index}",
+                'operation': operation,
+                'settings': settings,
+                'input': small,
+                'live': outcome(run_live, operation, settings, small),
+                'reference': outcome(run_reference, operation, settings, small),
+            })
+    return count, failures, reports
+
+def run(count, jobs=1, seed=0):
+    """Runs `count` cases over `jobs` worker processes; returns (failures, reports)."""
+    blocks = [(seed, block, min(BLOCK_SIZE, count - block * BLOCK_SIZE))
+              for block in range((count + BLOCK_SIZE - 1) // BLOCK_SIZE)]
+
+    if jobs == 1:
+        results = [run_block(*args) for args in blocks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(run_block, *zip(*blocks)))
+
+    failures = sum(result[1] for result in results)
+    reports = [report for result in results for report in result[2]]
+    return failures, reports
+
+def format_report(report):
+    return (f"case {report['case']} ({report['operation']})\n"
+            f"  settings:  {report['settings']!r}\n"
+            f"  input:     {report['input']!r}\n"
+            f"  live:      {report['live']!r}\n"
+            f"  reference: {report['reference']!r}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare zid_name against the frozen reference implementation.")
+    parser.add_argument("--count", type=int, default=100000, help="Randomized cases to run (default: 100000).")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (0 = one per CPU, default: 1).")
+    parser.add_argument("--seed", type=int, default=20240929, help="Seed for case generation.")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    failures, reports = run(args.count, args.jobs or os.cpu_count() or 1, args.seed)
+    elapsed = time.perf_counter() - start
+
+    for report in reports:
+        print(format_report(report))
+    print(f"{args.count} cases, {failures} mismatches in {elapsed:.1f}s", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
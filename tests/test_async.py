@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import asyncio
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import AsyncSlugifier, aprocess, aslugify
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+class TestAsync(unittest.TestCase):
+    """
+    Tests for the asyncio API (aslugify, aprocess, aprocess_stream).
+    """
+
+    def test_concurrent_requests(self):
+        async def run():
+            slugifier = AsyncSlugifier(CONFIG)
+            return await asyncio.gather(
+                slugifier.slugify("Große Straße in Berlin heute"),
+                slugifier.process("20260105120000 Task One\nSimple Title"),
+                slugifier.slugify("Äpfel Öfen Überraschung"),
+            )
+
+        self.assertEqual(asyncio.run(run()), [
+            "grosse-strasse-in-berlin",
+            "20260105120000-task-one\nSimple Title",
+            "aepfel-oefen-ueberraschung",
+        ])
+
+    def test_large_batch_offloaded(self):
+        text = "\n".join(f"2026010512{i:04d} Task Nummer {i}" for i in range(1000))
+        self.assertGreater(len(text), zid_name.ASYNC_INLINE_LIMIT)
+
+        async def run():
+            return await AsyncSlugifier(CONFIG).process(text)
+
+        self.assertEqual(asyncio.run(run()), zid_name.Slugifier(CONFIG).process(text))
+
+    def test_stream(self):
+        async def lines():
+            for i in range(25):
+                yield f"- [ ] 2026010512{i:04d} Übung {i}\r\n"
+                yield "Comment\n"
+
+        async def run():
+            return [line async for line in AsyncSlugifier(CONFIG).process_stream(lines(), batch_size=7)]
+
+        result = asyncio.run(run())
+        self.assertEqual(len(result), 50)
+        self.assertEqual(result[0], "- [ ] 20260105120000-uebung-0\r\n")
+        self.assertEqual(result[1], "Comment\n")
+
+    def test_errors_are_propagated(self):
+        async def run():
+            return await AsyncSlugifier(CONFIG).slugify(b"Not. A str")
+
+        with self.assertRaises(TypeError):
+            asyncio.run(run())
+
+    @patch('zid_name._async_slugifier', None)
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_module_functions(self, mock_get_config):
+        async def run():
+            return await aslugify("Title. Description"), await aprocess("20260104222054 Große Straße")
+
+        self.assertEqual(asyncio.run(run()), ("title-description", "20260104222054-grosse-strasse"))
+        mock_get_config.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
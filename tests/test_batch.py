@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zid_name import Slugifier, slugify_array, slugify_many
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '. ': '-', '.': '-'
+    }
+}
+
+TITLES = [
+    "Häuser, Schlösser, Füße und Fußball sind schön",
+    "STRASSE GROẞ",
+    "Title. Description",
+    "Task One - ",
+    "",
+    "   ",
+    "file Name.1.ru.mp4",
+    "Archive.tar.gz",
+    "20251114155621 IT Projektleiter _ Projektmanager (m_w_d) bei HENRICHSEN AG _ softgarden.pdf",
+    "Привет мир Ёлка",
+    "Two\nLines In One Title",
+    "..  . .. ._:_:",
+] * 3
+
+class TestBatch(unittest.TestCase):
+    """
+    Tests that the batch API returns exactly what per-title slugify returns.
+    """
+
+    def assertBatchEqual(self, settings, titles=TITLES):
+        slugifier = Slugifier(settings)
+        expected = [slugifier.slugify(title) for title in titles]
+        self.assertEqual(slugifier.slugify_many(titles), expected)
+        self.assertEqual(slugifier.slugify_many(titles, dedupe=True), expected)
+        self.assertEqual(slugifier.slugify_many(iter(titles)), expected)
+
+    def test_default_config(self):
+        self.assertBatchEqual(CONFIG)
+
+    def test_extension_depths(self):
+        self.assertBatchEqual(dict(CONFIG, preserve_extension_depth=2))
+        self.assertBatchEqual(dict(CONFIG, slugify_extension_depth=3))
+
+    def test_uppercase_and_separator(self):
+        self.assertBatchEqual(dict(CONFIG, lowercase=False, separator='_'))
+
+    def test_newline_replacement_falls_back(self):
+        settings = dict(CONFIG, replacements={'\n': ' ', '.': '-'})
+        self.assertFalse(Slugifier(settings)._batchable)
+        self.assertBatchEqual(settings)
+
+    def test_batch_boundaries(self):
+        titles = [f"Note {i} für Übung.md" for i in range(10000)]
+        self.assertBatchEqual(dict(CONFIG, preserve_extension_depth=1), titles)
+
+    def test_module_function(self):
+        self.assertEqual(slugify_many(["Übung macht den Meister"], CONFIG), ["uebung-macht-den-meister"])
+        self.assertEqual(slugify_many([], CONFIG), [])
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_numpy_array(self):
+        values = numpy.array(["Title. Description", None, "Title. Description"], dtype=object)
+        result = slugify_array(values, CONFIG)
+        self.assertEqual(result.dtype, object)
+        self.assertEqual(result.tolist(), ["title-description", None, "title-description"])
+
+    @unittest.skipUnless(pandas, "pandas is not installed")
+    def test_pandas_series(self):
+        series = pandas.Series(["Große Straße", None], index=[10, 20], name="title")
+        result = slugify_array(series, CONFIG)
+        self.assertEqual(result.tolist(), ["grosse-strasse", None])
+        self.assertEqual(result.index.tolist(), [10, 20])
+        self.assertEqual(result.name, "title")
+
+if __name__ == '__main__':
+    unittest.main()
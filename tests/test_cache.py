@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import SlugCache, Slugifier, cache_info, disable_cache, enable_cache, sanitizeName
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+class TestCache(unittest.TestCase):
+    """
+    Tests for the opt-in LRU cache of slugify results.
+    """
+
+    def test_hits_misses_and_eviction(self):
+        slugifier = Slugifier(CONFIG)
+        cache = SlugCache(max_entries=2)
+        slugifier.set_cache(cache)
+
+        self.assertEqual(slugifier.slugify("Große Straße"), "grosse-strasse")
+        self.assertEqual(slugifier.slugify("Große Straße"), "grosse-strasse")
+        slugifier.slugify("Second Title")
+        slugifier.slugify("Third Title")  # evicts "Große Straße"
+        slugifier.slugify("Große Straße")
+
+        info = cache.info()
+        self.assertEqual((info['hits'], info['misses'], info['evictions'], info['entries']), (1, 4, 2, 2))
+
+        slugifier.set_cache(None)
+        slugifier.slugify("Große Straße")
+        self.assertEqual(cache.info()['misses'], 4)
+
+    def test_byte_limit(self):
+        slugifier = Slugifier(CONFIG)
+        cache = SlugCache(max_bytes=1000)
+        slugifier.set_cache(cache)
+        for i in range(100):
+            slugifier.slugify(f"Title number {i}")
+        self.assertLessEqual(cache.info()['bytes'], 1000)
+        self.assertGreater(cache.info()['evictions'], 0)
+
+    def test_config_change_never_hits(self):
+        cache = SlugCache(max_entries=10)
+        first = Slugifier(CONFIG)
+        second = Slugifier(dict(CONFIG, slug_word_count=1))
+        first.set_cache(cache)
+        second.set_cache(cache)
+
+        self.assertEqual(first.slugify("One Two"), "one-two")
+        self.assertEqual(second.slugify("One Two"), "one")
+        self.assertEqual(cache.info()['hits'], 0)
+
+    def test_default_limit(self):
+        self.addCleanup(disable_cache)
+        with patch('zid_name.SLUG_CACHE_MAX_ENTRIES', 3):
+            cache = enable_cache()
+        self.assertEqual(cache.max_entries, 3)
+        for i in range(10):
+            sanitizeName(f"Title {i}", CONFIG)
+        self.assertEqual(cache_info()['entries'], 3)
+        self.assertEqual(cache_info()['evictions'], 7)
+        self.assertIsNone(SlugCache(max_bytes=1000).max_entries)
+
+    def test_module_cache(self):
+        enable_cache(max_entries=100)
+        self.addCleanup(disable_cache)
+
+        sanitizeName("Äpfel Öfen Überraschung", CONFIG)
+        sanitizeName("Äpfel Öfen Überraschung", CONFIG)
+        self.assertEqual(cache_info()['hits'], 1)
+
+        disable_cache()
+        self.assertIsNone(cache_info())
+        self.assertNotIn('slugify', zid_name.compile_config(CONFIG).__dict__)
+
+if __name__ == '__main__':
+    unittest.main()
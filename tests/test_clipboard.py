@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import CommandClipboard, FileClipboard, MemoryClipboard, get_clipboard, probe_clipboard, set_clipboard
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+class TestClipboard(unittest.TestCase):
+    """
+    Tests for the clipboard backends and the CLI clipboard round-trip.
+    """
+
+    def tearDown(self):
+        set_clipboard(None)
+
+    def test_probe_once(self):
+        with patch.dict(os.environ, {'ZID_NAME_CLIPBOARD': 'memory'}):
+            set_clipboard(None)
+            clipboard = get_clipboard()
+        self.assertIsInstance(clipboard, MemoryClipboard)
+        self.assertIs(get_clipboard(), clipboard)
+
+    def test_probe_prefers_pipe_tools(self):
+        environ = {key: value for key, value in os.environ.items()
+                   if key not in ('ZID_NAME_CLIPBOARD', 'WAYLAND_DISPLAY', 'DISPLAY')}
+        which = patch('shutil.which', side_effect=lambda name: f"/usr/bin/{name}" if name == 'xsel' else None)
+        with patch.dict(os.environ, dict(environ, DISPLAY=':0'), clear=True), \
+             patch.object(sys, 'platform', 'linux'), which:
+            clipboard = probe_clipboard()
+        self.assertEqual(clipboard.name, 'xsel')
+        self.assertEqual(clipboard.copy_command, ['xsel', '--clipboard', '--input'])
+
+        # Without an X11 session (SSH, cron) xsel cannot work, even if installed
+        with patch.dict(os.environ, environ, clear=True), patch.object(sys, 'platform', 'linux'), which, \
+             patch('zid_name.PyperclipClipboard', return_value=MemoryClipboard()):
+            self.assertIsInstance(probe_clipboard(), MemoryClipboard)
+
+    def test_file_backend(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            clipboard = FileClipboard(os.path.join(tmp, 'clipboard.txt'))
+            self.assertEqual(clipboard.paste(), "")
+            clipboard.copy("Line One\r\nÜbung")
+            self.assertEqual(clipboard.paste(), "Line One\r\nÜbung")
+
+    def test_command_backend_uses_pipes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'clipboard.txt')
+            clipboard = CommandClipboard(
+                'fake',
+                [sys.executable, '-c', f"import sys; sys.stdout.buffer.write(open({path!r}, 'rb').read())"],
+                [sys.executable, '-c', f"import sys; open({path!r}, 'wb').write(sys.stdin.buffer.read())"])
+            # Far larger than any argv/environment limit
+            payload = "20260105120000 Große Straße\n" * 200_000
+            clipboard.copy(payload)
+            self.assertEqual(clipboard.paste(), payload)
+
+            failing = CommandClipboard('fake', [sys.executable, '-c', "raise SystemExit(\"Error: Can't open display\")"],
+                                       [sys.executable, '-c', 'raise SystemExit(1)'])
+            with self.assertRaisesRegex(OSError, "Can't open display"):
+                failing.paste()
+            with self.assertRaises(OSError):
+                failing.copy("text")
+
+            empty = CommandClipboard('fake', [sys.executable, '-c', 'raise SystemExit("Error: target STRING not available")'],
+                                     [sys.executable, '-c', 'pass'])
+            self.assertEqual(empty.paste(), "")
+
+    def test_cli_reports_unreadable_clipboard(self):
+        set_clipboard(CommandClipboard('fake', [sys.executable, '-c', 'raise SystemExit(1)'], [sys.executable, '-c', 'pass']))
+        with patch('builtins.print') as mock_print, self.assertRaises(SystemExit) as exit_info:
+            zid_name.main([])
+        self.assertIn("cannot read the clipboard", str(exit_info.exception.code))
+        mock_print.assert_not_called()
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_cli_round_trip(self, mock_get_config):
+        clipboard = MemoryClipboard("20260105120000 Große Straße")
+        set_clipboard(clipboard)
+        with patch('builtins.print'):
+            zid_name.main([])
+        self.assertEqual(clipboard.text, "20260105120000-grosse-strasse")
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_unchanged_output_is_not_written(self, mock_get_config):
+        clipboard = MemoryClipboard("20260105120000-grosse-strasse")
+        set_clipboard(clipboard)
+        with patch.object(clipboard, 'copy') as mock_copy, patch('builtins.print') as mock_print:
+            zid_name.main(['--debug'])
+        mock_copy.assert_not_called()
+        debug = mock_print.call_args_list[0]
+        self.assertIn("clipboard=memory", debug.args[0])
+        self.assertIn("write skipped", debug.args[0])
+        self.assertEqual(debug.kwargs, {'file': sys.stderr})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import subprocess
+import tempfile
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import compile_config_snapshot, get_config, get_profiles, load_config_snapshot, parse_config
+
+CONFIG_INI = """\
+[Settings]
+slug_word_count = 3
+preserve_extension_depth = 1
+
+[Format]
+separator = _
+
+[Replacements]
+ä = ae
+. = _
+
+[profile:titles]
+lowercase = false
+"""
+
+class TestConfigSnapshot(unittest.TestCase):
+    """
+    Tests for the compiled config.ini snapshot (zid_name config compile).
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'config.ini')
+        self.write_config(CONFIG_INI)
+        patches = [patch('zid_name.CONFIG_PATH', self.path),
+                   patch.dict(zid_name._config_cache, {'mtime': None, 'settings': None, 'profiles': None})]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def write_config(self, text, mtime_ns=None):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def reset_cache(self):
+        zid_name._config_cache.update({'mtime': None, 'settings': None, 'profiles': None})
+
+    def test_snapshot_matches_ini(self):
+        snapshot_path, source_hash = compile_config_snapshot(self.path)
+        self.assertTrue(os.path.exists(snapshot_path))
+        self.assertEqual(len(source_hash), 8)
+
+        with patch('zid_name.parse_config') as mock_parse:
+            self.assertEqual((get_config(), get_profiles()), parse_config(self.path))
+        mock_parse.assert_not_called()
+
+    def test_modified_ini_is_parsed_again(self):
+        compile_config_snapshot(self.path)
+        mtime = os.stat(self.path).st_mtime_ns
+        self.write_config(CONFIG_INI.replace("slug_word_count = 3", "slug_word_count = 5"), mtime + 1_000_000_000)
+
+        self.assertIsNone(load_config_snapshot(self.path))
+        self.assertEqual(get_config()['slug_word_count'], 5)
+
+        compile_config_snapshot(self.path)
+        self.reset_cache()
+        with patch('zid_name.parse_config') as mock_parse:
+            self.assertEqual(get_config()['slug_word_count'], 5)
+        mock_parse.assert_not_called()
+
+    def test_replaced_ini_with_same_mtime_and_size(self):
+        compile_config_snapshot(self.path)
+        mtime = os.stat(self.path).st_mtime_ns
+        # e.g. cp -p or rsync: other content, same length, original mtime
+        self.write_config(CONFIG_INI.replace("slug_word_count = 3", "slug_word_count = 5"), mtime)
+        self.assertEqual(os.stat(self.path).st_size, len(CONFIG_INI.encode('utf-8')))
+
+        self.assertIsNone(load_config_snapshot(self.path))
+        self.assertEqual(get_config()['slug_word_count'], 5)
+
+    def test_outdated_or_broken_snapshot_is_ignored(self):
+        snapshot_path, _ = compile_config_snapshot(self.path)
+        with patch('zid_name.CONFIG_SNAPSHOT_VERSION', zid_name.CONFIG_SNAPSHOT_VERSION + 1):
+            self.assertIsNone(load_config_snapshot(self.path))
+        with open(snapshot_path, 'wb') as f:
+            f.write(b'not a snapshot')
+        self.assertIsNone(load_config_snapshot(self.path))
+        self.assertEqual(get_config()['separator'], '_')
+
+    def test_validation_errors(self):
+        broken = {
+            "slug_word_count = 3": "slug_word_count = 0",
+            "preserve_extension_depth = 1": "preserve_extension_depth = -1",
+            "separator = _": "separator = _\nseperator = -",
+            "[Replacements]": "[Settings]\nallowed_chars_regex = [^a-z",
+            "lowercase = false": "lowercase = maybe",
+            "[Settings]": "[Setings]",
+        }
+        for old, new in broken.items():
+            with self.subTest(new=new):
+                self.write_config(CONFIG_INI.replace(old, new))
+                with self.assertRaises(ValueError):
+                    compile_config_snapshot(self.path)
+                self.assertFalse(os.path.exists(zid_name.config_snapshot_path(self.path)))
+
+    def test_cli(self):
+        with patch('builtins.print') as mock_print:
+            self.assertEqual(zid_name.config_main(['check']), 1)
+            self.assertEqual(zid_name.config_main(['compile']), 0)
+            self.assertEqual(zid_name.config_main(['check']), 0)
+        self.assertIn("Compiled", mock_print.call_args_list[1].args[0])
+
+        self.write_config("[Settings]\nslug_word_count = many\n")
+        with patch('sys.stderr') as mock_stderr, self.assertRaises(SystemExit) as cm:
+            zid_name.main(['config', 'compile'])
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn("slug_word_count", "".join(call.args[0] for call in mock_stderr.write.call_args_list))
+
+    def test_snapshot_start_skips_configparser(self):
+        compile_config_snapshot(self.path)
+        code = (f"import sys, zid_name; zid_name.CONFIG_PATH = {self.path!r}; "
+                "print(zid_name.process_string('Ein Bericht über Häuser.pdf'), 'configparser' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(zid_name.__file__),
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), ["ein_bericht_ber.pdf", "False"])
+
+if __name__ == '__main__':
+    unittest.main()
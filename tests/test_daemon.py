@@ -0,0 +1,160 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import socket
+import tempfile
+import threading
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zid_name import client_process_string, daemon_token_path, make_server, request_daemon
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix domain sockets not available")
+class TestDaemon(unittest.TestCase):
+    """
+    Tests for the resident daemon (--serve) and its client (--client).
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.address = os.path.join(self.tmp.name, 'zid-name.sock')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def start_server(self):
+        server = make_server(self.address)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        self.addCleanup(stop)
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_requests(self, mock_get_config):
+        self.start_server()
+        self.assertEqual(request_daemon('slugify', "Große Straße in Berlin heute", self.address),
+                         "grosse-strasse-in-berlin")
+        self.assertEqual(request_daemon('process', "20260105120000 Task One\nSimple Title", self.address),
+                         "20260105120000-task-one\nSimple Title")
+        with self.assertRaises(ValueError):
+            request_daemon('unknown', "text", self.address)
+
+    @patch('zid_name.get_config')
+    def test_config_hot_reload(self, mock_get_config):
+        mock_get_config.return_value = CONFIG
+        self.start_server()
+        self.assertEqual(request_daemon('slugify', "One Two Three", self.address), "one-two-three")
+
+        # A changed config (new settings object) is used by the next request
+        mock_get_config.return_value = dict(CONFIG, slug_word_count=2)
+        self.assertEqual(request_daemon('slugify', "One Two Three", self.address), "one-two")
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_client_falls_back_without_daemon(self, mock_get_config):
+        self.assertEqual(client_process_string("Äpfel Öfen Überraschung", self.address),
+                         "aepfel-oefen-ueberraschung")
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_foreign_socket_is_not_used(self, mock_get_config):
+        self.start_server()
+        self.assertEqual(os.stat(self.address).st_mode & 0o777, 0o600)
+
+        # A socket owned by another user (e.g. planted in /tmp) never receives the text
+        with patch('os.getuid', return_value=os.getuid() + 1), \
+             patch('zid_name.process_string', return_value="local") as mock_process:
+            with self.assertRaises(PermissionError):
+                request_daemon('slugify', "Secret Clipboard Text", self.address)
+            self.assertEqual(client_process_string("Secret Clipboard Text", self.address), "local")
+        mock_process.assert_called_once()
+
+class TestTcpDaemon(unittest.TestCase):
+    """
+    Tests for the localhost TCP daemon (--port) and its shared-secret handshake.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch.dict(os.environ, {'XDG_RUNTIME_DIR': self.tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def start_server(self):
+        server = make_server(('127.0.0.1', 0))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        self.addCleanup(stop)
+        return server.server_address
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_requests(self, mock_get_config):
+        address = self.start_server()
+        token_path = daemon_token_path(address[1])
+        self.assertTrue(token_path.startswith(self.tmp.name))
+        if os.name == 'posix':
+            self.assertEqual(os.stat(token_path).st_mode & 0o777, 0o600)
+        self.assertEqual(request_daemon('slugify', "Große Straße in Berlin heute", address),
+                         "grosse-strasse-in-berlin")
+
+        # A client without the secret is refused
+        with socket.create_connection(address, timeout=2) as sock, sock.makefile('rb') as reader:
+            sock.sendall(b'{"hello": "x"}\n{"op": "slugify", "text": "Title", "auth": "guess"}\n')
+            reader.readline()
+            self.assertIn(b"Not authorized", reader.readline())
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_impostor_never_receives_text(self, mock_get_config):
+        # Another local user listening on the port, without the secret
+        listener = socket.create_server(('127.0.0.1', 0))
+        self.addCleanup(listener.close)
+        address = listener.getsockname()
+        with open(daemon_token_path(address[1]), 'w') as f:
+            f.write("0" * 64)
+        received = []
+
+        def impostor():
+            conn, _ = listener.accept()
+            with conn, conn.makefile('rb') as reader:
+                received.append(reader.readline())
+                conn.sendall(b'{"proof": "forged", "challenge": "x"}\n')
+                received.append(reader.read())
+        thread = threading.Thread(target=impostor, daemon=True)
+        thread.start()
+
+        with patch('zid_name.process_string', return_value="local"):
+            self.assertEqual(client_process_string("Secret Clipboard Text", address), "local")
+        thread.join(2)
+        self.assertNotIn(b"Secret", b"".join(received))
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_client_falls_back_without_token(self, mock_get_config):
+        with patch('zid_name.process_string', return_value="local"):
+            self.assertEqual(client_process_string("Title", ('127.0.0.1', 1)), "local")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import differential
+from zid_name import Slugifier
+
+class TestDifferential(unittest.TestCase):
+    """
+    Runs a small slice of the differential harness (tests/differential.py).
+    """
+
+    def test_live_matches_reference(self):
+        failures, reports = differential.run(6000, jobs=1, seed=1)
+        self.assertEqual(failures, 0, "\n".join(map(differential.format_report, reports)))
+
+    def test_parallel_run(self):
+        failures, reports = differential.run(2 * differential.BLOCK_SIZE, jobs=2, seed=2)
+        self.assertEqual((failures, reports), (0, []))
+
+    def test_reports_minimized_counterexample(self):
+        slugify = Slugifier.slugify
+
+        def drifted(self, inputString):
+            result = slugify(self, inputString)
+            return result + "!" if "ẞ" in inputString else result
+
+        with patch.object(Slugifier, 'slugify', drifted):
+            failures, reports = differential.run(differential.BLOCK_SIZE, jobs=1, seed=3)
+
+        self.assertGreater(failures, 0)
+        report = reports[0]
+        self.assertEqual(report['input'].strip(), "ẞ")
+        self.assertEqual(report['live'], report['reference'] + "!")
+
+if __name__ == '__main__':
+    unittest.main()
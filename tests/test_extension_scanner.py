@@ -0,0 +1,91 @@
+import unittest
+import random
+import re
+import sys
+import os
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zid_name import Slugifier
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+# Characters that matter to the scanner: dots, empty parts and every kind of whitespace
+ALPHABET = ['.', '.', '.', ' ', '\t', ' ', ' ', '\n', 'a', 'B', 'z', '1', 'Ä', 'ё', '-', '_']
+
+def reference_split_extension(inputString, preserve_depth, slugify_depth, separator='-', lowercase=True):
+    """Reference implementation: the original split/join loop over every candidate depth."""
+    extension_suffix = ""
+    parts = inputString.split('.')
+    effective_level = 0
+
+    if preserve_depth > 0:
+        effective_level = min(preserve_depth, len(parts) - 1)
+    elif slugify_depth > 0:
+        effective_level = min(slugify_depth, len(parts) - 1)
+
+    if effective_level > 0:
+        found_extensions = []
+        found_stem = []
+
+        for depth in range(effective_level, 0, -1):
+            potential_extensions = parts[-depth:]
+            if all(ext and not re.search(r'\s', ext) for ext in potential_extensions):
+                found_extensions = potential_extensions
+                found_stem = parts[:-depth]
+                break
+
+        if found_extensions:
+            inputString = ".".join(found_stem)
+            if preserve_depth > 0:
+                extension_suffix = "." + ".".join(found_extensions)
+            elif slugify_depth > 0:
+                extension_suffix = separator + separator.join(found_extensions)
+                if lowercase:
+                    extension_suffix = extension_suffix.lower()
+
+    return inputString, extension_suffix
+
+class TestExtensionScanner(unittest.TestCase):
+    """
+    Fuzz tests that the right-to-left extension scanner matches the original loop.
+    """
+
+    def test_fuzz_against_reference(self):
+        rng = random.Random(20240929)
+        slugifiers = {}
+        for preserve in range(4):
+            for slugify in range(4):
+                for lowercase in (True, False):
+                    settings = dict(CONFIG, preserve_extension_depth=preserve,
+                                    slugify_extension_depth=slugify, lowercase=lowercase)
+                    slugifiers[(preserve, slugify, lowercase)] = Slugifier(settings)
+
+        for _ in range(3000):
+            text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 16)))
+            for (preserve, slugify, lowercase), slugifier in slugifiers.items():
+                expected = reference_split_extension(text, preserve, slugify, lowercase=lowercase)
+                self.assertEqual(slugifier.split_extension(text), expected,
+                                 msg=f"{text!r} preserve={preserve} slugify={slugify} lowercase={lowercase}")
+
+    def test_many_dots(self):
+        text = "Version 1.2.3. Released. Notes" + ".x" * 500 + ".tar.gz"
+        for preserve, slugify in ((2, 0), (0, 3), (50, 0)):
+            slugifier = Slugifier(dict(CONFIG, preserve_extension_depth=preserve, slugify_extension_depth=slugify))
+            self.assertEqual(slugifier.split_extension(text), reference_split_extension(text, preserve, slugify))
+
+if __name__ == '__main__':
+    unittest.main()
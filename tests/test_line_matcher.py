@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+import random
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zid_name import Slugifier, lineRegex, prefixOnlyRegex, zidLineRegex
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': True,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+PIECES = ["- ", "* ", "+ ", "1. ", "12.", "# ", "###### ", "####### ", "[ ] ", "[x] ", "[X]",
+          " ", "\t", "\xa0", "20260105120000", "2026010512000", "202601051200001",
+          "٢٠٢٦٠١٠٥١٢٠٠٠٠", "a", "Übung", ".", "-", "_", ". "]
+
+def classify_two_pass(line):
+    """Reference: the original zidLineRegex / prefixOnlyRegex sequence."""
+    zid_match = zidLineRegex.match(line)
+    if zid_match:
+        return ('zid', zid_match.group(1) or "", zid_match.group(2), zid_match.group(3))
+    prefix_match = prefixOnlyRegex.match(line)
+    if prefix_match:
+        return ('prefix', prefix_match.group(1), None, prefix_match.group(2))
+    return ('plain', None, None, None)
+
+def classify_one_pass(line):
+    line_match = lineRegex.match(line)
+    if line_match is None:
+        return ('plain', None, None, None)
+    if line_match.group(3) is not None:
+        return ('zid', line_match.group(1), line_match.group(3), line_match.group(4))
+    if line_match.group(2) is not None:
+        return ('prefix', line_match.group(1), None, line_match.group(4))
+    return ('plain', None, None, None)
+
+class TestLineMatcher(unittest.TestCase):
+    """
+    Tests that the combined line matcher classifies lines like the original two regexes.
+    """
+
+    def test_random_lines(self):
+        rng = random.Random(20260105)
+        for _ in range(20000):
+            line = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 7)))
+            self.assertEqual(classify_one_pass(line), classify_two_pass(line), msg=repr(line))
+
+    def test_indented_plain_line(self):
+        # Indentation alone is not a list prefix
+        slugifier = Slugifier(CONFIG)
+        self.assertEqual(slugifier.process_line("    Indented plain line"), "indented-plain-line")
+        self.assertEqual(slugifier.process_line("  - Indented item"), "  - indented-item")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import io
+import tracemalloc
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import Slugifier
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+# Peak traced allocations while processing, as a multiple of the input size.
+# The result itself is about 1x and is joined from chunks of the same total
+# size; the list-based version needed about 3.5x.
+BATCH_MEMORY_BUDGET = 2.0
+# An unchanged batch is passed through; only a few chunks are in memory at a time
+UNCHANGED_MEMORY_BUDGET_CHUNKS = 8
+
+def peak_memory(func, text):
+    tracemalloc.start()
+    try:
+        func(text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+class TestMemory(unittest.TestCase):
+    """
+    Memory benchmark for batch processing of large multi-line inputs.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.slugifier = Slugifier(CONFIG)
+        lines = []
+        for i in range(20000):
+            lines.append(f"- [ ] 2026010512{i % 10000:04d} Task Nummer {i} für die Übung")
+            lines.append(f"Just some comment number {i} that stays as it is.")
+        cls.batch = "\n".join(lines) + "\n"
+        cls.unchanged = "\n".join(line for line in lines if not line.startswith("-"))
+
+    def test_batch_peak_memory(self):
+        peak = peak_memory(self.slugifier.process, self.batch)
+        self.assertLess(peak / sys.getsizeof(self.batch), BATCH_MEMORY_BUDGET)
+
+    def test_unchanged_batch_is_passed_through(self):
+        self.assertIs(self.slugifier.process(self.unchanged), self.unchanged)
+        peak = peak_memory(self.slugifier.process, self.unchanged)
+        self.assertLess(peak, UNCHANGED_MEMORY_BUDGET_CHUNKS * zid_name.PROCESS_CHUNK_SIZE)
+
+    def test_same_result_as_splitlines(self):
+        process_line = self.slugifier.process_line
+        expected = "\n".join([process_line(line) for line in self.batch.splitlines()])
+        self.assertEqual(self.slugifier.process(self.batch), expected)
+
+        for passthrough in (False, True):
+            target = io.StringIO()
+            self.slugifier.process_into(self.batch, target, passthrough)
+            self.assertEqual(target.getvalue(), expected)
+
+    def test_splitlines_boundaries(self):
+        text = "20260105120000 A\r\nB\rC\x0bD\x0cE\x1cF\x85G H \n\n20260105120001 Ä\r\n"
+        process_line = self.slugifier.process_line
+        self.assertEqual(self.slugifier.process(text), "\n".join(process_line(line) for line in text.splitlines()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import get_profiles, get_slugifier, parse_config, process_string, sanitizeName
+
+CONFIG_INI = """\
+[Settings]
+slug_word_count = 4
+slugify_extension_depth = 0
+
+[Format]
+lowercase = true
+separator = -
+
+[Replacements]
+ä = ae
+_ = -
+. = -
+
+[profile:filenames]
+slug_word_count = 8
+separator = _
+preserve_extension_depth = 2
+
+[profile:filenames:replacements]
+ä = a
+. = _
+
+[profile:titles]
+lowercase = false
+"""
+
+class TestProfiles(unittest.TestCase):
+    """
+    Tests for named [profile:NAME] rule sets in config.ini.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'config.ini')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(CONFIG_INI)
+        patches = [patch('zid_name.CONFIG_PATH', self.path),
+                   patch.dict(zid_name._config_cache, {'mtime': None, 'settings': None, 'profiles': None})]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_profiles_inherit_base_settings(self):
+        settings, profiles = parse_config(self.path)
+        self.assertEqual(sorted(profiles), ['filenames', 'titles'])
+        self.assertEqual(profiles['filenames']['separator'], '_')
+        self.assertEqual(profiles['filenames']['replacements'], {'ä': 'a', '.': '_'})
+        self.assertEqual(profiles['titles']['slug_word_count'], 4)
+        self.assertIs(profiles['titles']['replacements'], settings['replacements'])
+
+    def test_process_string_profile(self):
+        text = "Mein Bericht über Häuser und Gärten.tar.gz"
+        self.assertEqual(process_string(text), "mein-bericht-ber-haeuser")
+        self.assertEqual(process_string(text, profile='filenames'), "mein_bericht_ber_hauser_und_garten.tar.gz")
+        self.assertEqual(process_string(text, profile='titles'), "Mein-Bericht-ber-Haeuser")
+        self.assertEqual(sanitizeName("Große Häuser", 'titles'), "Groe-Haeuser")
+
+    def test_compiled_once(self):
+        first = get_slugifier('filenames')
+        self.assertIs(get_slugifier('filenames'), first)
+        self.assertIsNot(get_slugifier('titles'), first)
+        self.assertEqual(first.settings, get_profiles()['filenames'])
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            process_string("Title", profile='missing')
+
+    def test_bad_profile_is_dropped(self):
+        expected = parse_config(self.path)
+        for section in ("[profile:broken]\nslug_words = 3\n", "[profile:broken]\nlowercase = maybe\n"):
+            with self.subTest(section=section):
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    f.write(CONFIG_INI + "\n" + section)
+                with patch('builtins.print') as mock_print:
+                    # Base settings and the other profiles are kept
+                    self.assertEqual(parse_config(self.path), expected)
+                self.assertIn("'broken'", mock_print.call_args.args[0])
+                with self.assertRaises(ValueError):
+                    parse_config(self.path, strict=True)
+
+    @patch('zid_name.set_clipboard_text')
+    @patch('zid_name.get_clipboard_text')
+    def test_cli_config_profile(self, mock_paste, mock_copy):
+        with patch('builtins.print') as mock_print:
+            zid_name.main(['--no-clipboard', '--config-profile', 'filenames', '20260105120000 Übung.pdf'])
+        mock_print.assert_called_once_with("20260105120000_bung.pdf")
+
+        with patch('sys.stderr'), self.assertRaises(SystemExit):
+            zid_name.main(['--no-clipboard', '--config-profile', 'missing', 'Title'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import io
+import json
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import ProfilingSlugifier, SlugStats, Slugifier
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': True,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 1,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '. ': '-', '.': '-'
+    }
+}
+
+BATCH = "- [ ] 20260105120000 Task One\n- [x] Task Two\n- [ ] \nJust some comment\n\n## 20260105131245 Notes.md"
+
+class TestProfiling(unittest.TestCase):
+    """
+    Tests for the opt-in instrumentation (--profile, enable_profiling, SlugStats).
+    """
+
+    def tearDown(self):
+        zid_name.disable_profiling()
+
+    def test_same_output_as_slugifier(self):
+        profiling = ProfilingSlugifier(CONFIG, SlugStats())
+        plain = Slugifier(CONFIG)
+        self.assertEqual(profiling.process(BATCH), plain.process(BATCH))
+        self.assertEqual(profiling.slugify_many(["Übung. Macht", "a.PDF"]), plain.slugify_many(["Übung. Macht", "a.PDF"]))
+        stream = ["20260105120000 Große Straße\r\n", "Comment\n"]
+        self.assertEqual(list(profiling.process_stream(stream)), list(plain.process_stream(stream)))
+
+    def test_embedded_line_break(self):
+        profiling = ProfilingSlugifier(CONFIG, SlugStats())
+        plain = Slugifier(CONFIG)
+        for line in ("a\nb", "- [ ] a\nb", "20260105120000 a\nb"):
+            for force_sanitize in (False, True):
+                self.assertEqual(profiling.process_line(line, force_sanitize),
+                                 plain.process_line(line, force_sanitize), msg=repr(line))
+        self.assertEqual(profiling.process_line("a\nb", force_sanitize=True), "a-b")
+        self.assertEqual(profiling.stats.lines['plain'], 7)
+
+    def test_counters(self):
+        stats = SlugStats()
+        ProfilingSlugifier(CONFIG, stats).process(BATCH)
+        info = stats.info()
+
+        self.assertEqual(info['lines'], {'zid': 2, 'prefix': 1, 'plain': 1, 'skipped': 2})
+        self.assertEqual(info['stages']['process_line']['calls'], 6)
+        for stage in ('extension', 'replacements', 'filter', 'split', 'collapse', 'lowercase'):
+            self.assertEqual(info['stages'][stage]['calls'], 4)
+        self.assertEqual(info['bytes_in'], len(BATCH.encode('utf-8')))
+
+        stats.clear()
+        self.assertEqual(stats.info()['bytes_in'], 0)
+
+    def test_skipped_without_process_non_zid_lines(self):
+        stats = SlugStats()
+        ProfilingSlugifier(dict(CONFIG, process_non_zid_lines=False), stats).process(BATCH)
+        self.assertEqual(stats.lines, {'zid': 2, 'prefix': 0, 'plain': 0, 'skipped': 4})
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_enable_disable(self, mock_get_config):
+        self.assertIsNone(zid_name.profile_stats())
+        self.assertIs(type(zid_name.get_slugifier()), Slugifier)
+
+        zid_name.enable_profiling()
+        self.assertIsInstance(zid_name.get_slugifier(), ProfilingSlugifier)
+        zid_name.process_string("Simple Title")
+        self.assertEqual(zid_name.profile_stats()['lines']['plain'], 1)
+
+        zid_name.disable_profiling()
+        self.assertIsNone(zid_name.profile_stats())
+        self.assertIs(type(zid_name.get_slugifier()), Slugifier)
+
+    def test_report_formats(self):
+        stats = SlugStats()
+        ProfilingSlugifier(CONFIG, stats).process(BATCH)
+        self.assertEqual(json.loads(stats.to_json()), stats.info())
+        summary = stats.summary()
+        self.assertIn("lines: zid=2 prefix=1 plain=1 skipped=2", summary)
+        self.assertIn("replacements", summary)
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_cli_profile_json(self, mock_get_config):
+        stderr = io.StringIO()
+        with patch('builtins.print'), patch('atexit.register') as mock_register:
+            zid_name.main(['--profile', '--profile-format', 'json', '--no-clipboard', '20260105120000 Task'])
+        report, output_format = mock_register.call_args.args
+        with patch.object(sys, 'stderr', stderr):
+            report(output_format)
+        self.assertEqual(json.loads(stderr.getvalue())['lines']['zid'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
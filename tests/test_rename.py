@@ -0,0 +1,133 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import Slugifier, apply_renames, plan_renames, undo_renames
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 2,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+class TestRename(unittest.TestCase):
+    """
+    Tests for the bulk filesystem rename mode (zid_name rename).
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = self.tmp.name
+        self.slugifier = Slugifier(CONFIG)
+
+    def touch(self, *parts):
+        path = os.path.join(self.root, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, 'w').close()
+        return path
+
+    def tree(self):
+        result = []
+        for directory, dirs, files in os.walk(self.root):
+            for name in dirs + files:
+                result.append(os.path.relpath(os.path.join(directory, name), self.root))
+        return sorted(result)
+
+    def test_recursive_plan_and_apply(self):
+        self.touch("Meine Übung", "20251019150118 Große Straße.tar.gz")
+        self.touch("Meine Übung", "already-clean.md")
+        self.touch("Report Final.pdf")
+        self.touch(".hidden File")
+
+        renames, problems = plan_renames([self.root], self.slugifier, recursive=True)
+        self.assertEqual(problems, [])
+        # Contents are renamed before their directory
+        self.assertEqual(renames[0], (os.path.join(self.root, "Meine Übung", "20251019150118 Große Straße.tar.gz"),
+                                      os.path.join(self.root, "Meine Übung", "20251019150118-grosse-strasse.tar.gz")))
+        self.assertEqual(len(renames), 3)
+
+        journal = os.path.join(self.root, ".journal.jsonl")
+        apply_renames(renames, journal)
+        self.assertEqual(self.tree(), [".hidden File", ".journal.jsonl", "meine-uebung",
+                                       os.path.join("meine-uebung", "20251019150118-grosse-strasse.tar.gz"),
+                                       os.path.join("meine-uebung", "already-clean.md"),
+                                       "report-final.pdf"])
+
+        self.assertEqual(undo_renames(journal), 3)
+        self.assertIn(os.path.join("Meine Übung", "20251019150118 Große Straße.tar.gz"), self.tree())
+
+    def test_collisions_detected(self):
+        self.touch("Task One.md")
+        self.touch("Task_One.md")
+        self.touch("Other Note.md")
+        self.touch("other-note.md")
+
+        renames, problems = plan_renames([self.root], self.slugifier)
+        self.assertEqual(renames, [])
+        self.assertEqual(len(problems), 2)
+
+    def test_overlapping_arguments_planned_once(self):
+        self.touch("Sub Dir", "Inner Note.md")
+        note = self.touch("My File.txt")
+
+        arguments = [self.root, note, os.path.join(self.root, "Sub Dir"), self.root + os.sep]
+        renames, problems = plan_renames(arguments, self.slugifier, recursive=True)
+        self.assertEqual(problems, [])
+        self.assertEqual(len(renames), 3)
+        self.assertEqual(len(set(old_path for old_path, _ in renames)), 3)
+
+        apply_renames(renames, os.path.join(self.root, ".journal.jsonl"))
+        self.assertEqual(self.tree(), [".journal.jsonl", "my-file.txt", "sub-dir",
+                                       os.path.join("sub-dir", "inner-note.md")])
+
+    def test_file_below_renamed_directory(self):
+        self.touch("Sub Dir", "My File.txt")
+        arguments = [self.root, os.path.join(self.root, "Sub Dir", "My File.txt")]
+        renames, problems = plan_renames(arguments, self.slugifier)
+        self.assertEqual(problems, [])
+        self.assertEqual([os.path.basename(new_path) for _, new_path in renames], ["my-file.txt", "sub-dir"])
+
+        apply_renames(renames, os.path.join(self.root, ".journal.jsonl"))
+        self.assertEqual(self.tree(), [".journal.jsonl", "sub-dir", os.path.join("sub-dir", "my-file.txt")])
+
+    def test_missing_source_renames_nothing(self):
+        note = self.touch("Report Final.pdf")
+        renames, _ = plan_renames([self.root], self.slugifier)
+        renames.append((os.path.join(self.root, "Gone.md"), os.path.join(self.root, "gone.md")))
+
+        journal = os.path.join(self.root, ".journal.jsonl")
+        with self.assertRaises(FileNotFoundError):
+            apply_renames(renames, journal)
+        self.assertTrue(os.path.exists(note))
+        self.assertFalse(os.path.exists(journal))
+
+    def test_cli_dry_run_and_conflicts(self):
+        self.touch("Report Final.pdf")
+        with patch('zid_name.get_config', return_value=CONFIG), patch('builtins.print'):
+            with self.assertRaises(SystemExit) as exit_info:
+                zid_name.main(['rename', '--dry-run', self.root])
+            self.assertEqual(exit_info.exception.code, 0)
+            self.assertEqual(self.tree(), ["Report Final.pdf"])
+
+            self.touch("report-final.pdf")
+            with self.assertRaises(SystemExit) as exit_info:
+                zid_name.main(['rename', os.path.join(self.root, "Report Final.pdf")])
+            self.assertEqual(exit_info.exception.code, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import compile_replacements, read_config
+
+# Inputs collected from the existing test suite
+CORPUS = [
+    "Häuser, Schlösser, Füße und Fußball sind schön",
+    "Äpfel Öfen Überraschung",
+    "STRASSE GROẞ",
+    "Title. Description",
+    "A. B",
+    "Header - Subheader",
+    "Task One - ",
+    "20260105120000 Simple Task",
+    "file Name.1.ru.mp4",
+    "20251019150118 33716113-5cdf-4b25-b357-b30900efd993.avif",
+    "Archive.tar.gz",
+    "20251114155621 IT Projektleiter _ Projektmanager (m_w_d) bei HENRICHSEN AG _ softgarden.pdf",
+    "Title - Part.ext1.ext2",
+    "20251105125427 Nachrichten für Deutschlernende vom 04. November 2025  Nachrichten in Einfacher Sprache - English.ytsrv3.srt",
+    "+ 20260104223641 Übung macht den Meister",
+    "## 20260105131245 Just some notes here.",
+    "- [x] 20260105120001 Task Two - ",
+    "Ends with dot. ",
+    "..  . .. ._:_:",
+]
+
+DEFAULT_REPLACEMENTS = {
+    'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+    'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '. ': '-', '.': '-'
+}
+
+def ordered_replace(text, replacements):
+    """Reference implementation: the original per-entry str.replace loop."""
+    for char, replacement in replacements.items():
+        text = text.replace(char, replacement)
+    return text
+
+class TestReplacements(unittest.TestCase):
+    """
+    Tests that the compiled replacement table matches ordered str.replace semantics.
+    """
+
+    def assertEquivalent(self, replacements, corpus=CORPUS):
+        # Both the ordered loop and the single-pass table used for large maps
+        for threshold in (len(replacements) + 1, 0):
+            with patch('zid_name.TRANSLATE_MIN_REPLACEMENTS', threshold):
+                replace = compile_replacements(replacements)
+            for text in corpus:
+                self.assertEqual(replace(text), ordered_replace(text, replacements),
+                                 msg=f"{text!r} (threshold {threshold})")
+
+    def test_default_map(self):
+        self.assertEquivalent(DEFAULT_REPLACEMENTS)
+
+    def test_config_ini_map(self):
+        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.ini')
+        self.assertEquivalent(read_config(config_path)['replacements'])
+
+    def test_multi_char_precedence(self):
+        # '. ' listed before '.' wins; listed after, it can never match
+        with patch('zid_name.TRANSLATE_MIN_REPLACEMENTS', 0):
+            self.assertEqual(compile_replacements({'. ': '_', '.': '-'})("a. b.c"), "a_b-c")
+            self.assertEqual(compile_replacements({'.': '-', '. ': '_'})("a. b.c"), "a- b-c")
+        self.assertEquivalent({'. ': '_', '.': '-', '::': '~', ':': '-'})
+
+    def test_order_dependent_maps(self):
+        # Chained, overlapping and deleting maps must keep ordered semantics
+        corpus = CORPUS + ["abc", "abcabc", "aab", "a_b", "ab_ab"]
+        self.assertEquivalent({'a': 'b', 'b': 'c'}, corpus)
+        self.assertEquivalent({'bc': 'X', 'ab': 'Y'}, corpus)
+        self.assertEquivalent({'_': '', 'ab': 'Z'}, corpus)
+        self.assertEquivalent({'Ё': 'Е', 'Е': 'E'}, corpus)
+
+    def test_large_map(self):
+        # Transliteration-sized maps are compiled into a single pass
+        replacements = {chr(0x4e00 + i): f"x{i}" for i in range(300)}
+        replacements.update(DEFAULT_REPLACEMENTS)
+        self.assertGreaterEqual(len(replacements), zid_name.TRANSLATE_MIN_REPLACEMENTS)
+        corpus = CORPUS + ["".join(chr(0x4e00 + i) for i in range(0, 300, 7)) + " Straße. Ende"]
+        self.assertEquivalent(replacements, corpus)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import Slugifier, compile_config, get_config, get_slugifier, sanitizeName
+
+BASE_CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+class TestSlugifier(unittest.TestCase):
+    """
+    Tests for the compiled Slugifier engine and config caching.
+    """
+
+    def test_slugify_and_process(self):
+        slugifier = Slugifier(BASE_CONFIG)
+        self.assertEqual(slugifier.slugify("Große Straße in Berlin heute"), "grosse-strasse-in-berlin")
+        self.assertEqual(slugifier.process("20260104222054 Große Straße"), "20260104222054-grosse-strasse")
+        self.assertEqual(slugifier.process("20260105120000 Task One\nSimple Title"),
+                         "20260105120000-task-one\nSimple Title")
+
+    def test_compile_config_reuses_instance(self):
+        cfg = dict(BASE_CONFIG)
+        slugifier = compile_config(cfg)
+        self.assertIs(compile_config(cfg), slugifier)
+        self.assertIs(compile_config(slugifier), slugifier)
+        # A different dict (even with equal content) is compiled separately
+        self.assertIsNot(compile_config(dict(BASE_CONFIG)), slugifier)
+
+    def test_dict_modified_in_place_is_recompiled(self):
+        cfg = dict(BASE_CONFIG, replacements=dict(BASE_CONFIG['replacements']))
+        text = "Große Straße in Berlin heute"
+        self.assertEqual(sanitizeName(text, cfg), "grosse-strasse-in-berlin")
+        cfg['slug_word_count'] = 2
+        self.assertEqual(sanitizeName(text, cfg), "grosse-strasse")
+        cfg['replacements']['ß'] = 'sz'
+        self.assertEqual(sanitizeName(text, cfg), "grosze-strasze")
+        self.assertEqual(compile_config(cfg).settings['replacements']['ß'], 'sz')
+
+    def test_get_config_is_read_only(self):
+        settings = get_config()
+        with self.assertRaises(TypeError):
+            settings['slug_word_count'] = 1
+        with self.assertRaises(TypeError):
+            settings['replacements']['ß'] = 'sz'
+        copy = dict(settings)
+        copy['slug_word_count'] = 1
+        self.assertEqual(sanitizeName("One Two", copy), "one")
+        self.assertIs(get_config(), settings)
+
+    def test_module_functions_match_slugifier(self):
+        self.assertEqual(sanitizeName("Äpfel Öfen Überraschung", BASE_CONFIG),
+                         Slugifier(BASE_CONFIG).slugify("Äpfel Öfen Überraschung"))
+
+    def test_config_reloaded_only_on_mtime_change(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.ini')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("[Settings]\nslug_word_count = 2\n")
+
+            with patch('zid_name.CONFIG_PATH', path), \
+                 patch.dict(zid_name._config_cache, {'mtime': None, 'settings': None}):
+                first = get_config()
+                self.assertIs(get_config(), first)
+                self.assertIs(get_slugifier(), get_slugifier())
+                self.assertEqual(zid_name.process_string("One Two Three"), "one-two")
+
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write("[Settings]\nslug_word_count = 3\n")
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+                self.assertIsNot(get_config(), first)
+                self.assertEqual(zid_name.process_string("One Two Three"), "one-two-three")
+
+if __name__ == '__main__':
+    unittest.main()
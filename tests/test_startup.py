@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import subprocess
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The standard library modules zid_name imports at the top
+BASE_IMPORTS = ('operator', 'os', 're', 'sys', 'time', 'types')
+# Import time zid_name may add on top of BASE_IMPORTS, as a fraction of their own
+# import time (measured at 0.25-0.3, so this leaves 2.5-3x headroom on any machine)
+IMPORT_OVERHEAD_BUDGET = 0.75
+
+# Modules that must only be imported when the feature using them runs
+LAZY_MODULES = ('pyperclip', 'argparse', 'configparser', 'concurrent.futures')
+
+class TestStartup(unittest.TestCase):
+    """
+    Regression checks for the per-hotkey start-up cost of zid_name.
+    """
+
+    def run_python(self, *args):
+        return subprocess.run([sys.executable, *args], cwd=REPO_DIR, capture_output=True, text=True, check=True)
+
+    def import_time_us(self, modules):
+        """Best-of-3 cumulative -X importtime of a fresh interpreter importing modules (microseconds)."""
+        best = None
+        for _ in range(3):
+            result = self.run_python('-X', 'importtime', '-c', f"import {', '.join(modules)}")
+            total = 0
+            for line in result.stderr.splitlines():
+                fields = line.split('|')
+                # Top-level imports are indented by exactly one space
+                if len(fields) == 3 and fields[2].strip() in modules and not fields[2].startswith('  '):
+                    total += int(fields[1])
+            best = total if best is None else min(best, total)
+        return best
+
+    def test_import_time_budget(self):
+        # Warm up so the bytecode cache is written before measuring
+        self.run_python('-c', 'import zid_name')
+
+        baseline = self.import_time_us(BASE_IMPORTS)
+        cumulative = self.import_time_us(('zid_name',))
+        self.assertGreater(baseline, 0)
+        self.assertGreater(cumulative, 0)
+        self.assertLess(cumulative - baseline, baseline * IMPORT_OVERHEAD_BUDGET,
+                        f"zid_name: {cumulative} us, {', '.join(BASE_IMPORTS)}: {baseline} us")
+
+    def test_heavy_modules_not_imported(self):
+        code = f"import sys, zid_name; print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+        self.assertEqual(self.run_python('-c', code).stdout.strip(), "")
+
+    @patch('zid_name.set_clipboard_text')
+    @patch('zid_name.get_clipboard_text')
+    def test_no_clipboard(self, mock_paste, mock_copy):
+        with patch.object(sys, 'argv', ['zid_name.py', '--no-clipboard', '20260104222054 Große Straße']), \
+             patch('builtins.print') as mock_print:
+            zid_name.main()
+
+        mock_print.assert_called_once_with("20260104222054-grosse-strasse")
+        mock_paste.assert_not_called()
+        mock_copy.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
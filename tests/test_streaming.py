@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import io
+import tempfile
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import process_lines_parallel, process_stream, split_line_ending
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+class TestStreaming(unittest.TestCase):
+    """
+    Tests for line-by-line streaming mode (--stdin / --input / --output).
+    """
+
+    def test_split_line_ending(self):
+        self.assertEqual(split_line_ending("a\r\n"), ("a", "\r\n"))
+        self.assertEqual(split_line_ending("a\n"), ("a", "\n"))
+        self.assertEqual(split_line_ending("a\r"), ("a", "\r"))
+        self.assertEqual(split_line_ending("a"), ("a", ""))
+
+    def test_line_endings_preserved(self):
+        source = io.StringIO("- [ ] 20260105120000 Task One\r\nJust some comment\n20260105122633 Übung\r\n\n",
+                             newline='')
+        expected = ["- [ ] 20260105120000-task-one\r\n", "Just some comment\n",
+                    "20260105122633-uebung\r\n", "\n"]
+        self.assertEqual(list(process_stream(source, CONFIG)), expected)
+
+    def test_stream_is_lazy(self):
+        def lines():
+            yield "20260105120000 Task One\n"
+            raise AssertionError("read past the first line")
+
+        stream = process_stream(lines(), CONFIG)
+        self.assertEqual(next(stream), "20260105120000-task-one\n")
+
+    def test_parallel_matches_serial_order(self):
+        lines = []
+        for i in range(500):
+            lines.append(f"- [ ] 2026010512{i:04d} Task Nummer {i} für Übung\r\n")
+            lines.append(f"Comment {i}\n")
+        expected = list(process_stream(lines, CONFIG))
+        self.assertEqual(list(process_lines_parallel(lines, CONFIG, jobs=2, chunk_size=37)), expected)
+
+    @patch('zid_name.set_clipboard_text')
+    @patch('zid_name.get_clipboard_text')
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_cli_input_output_files(self, mock_get_config, mock_paste, mock_copy):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, 'in.md')
+            output_path = os.path.join(tmp, 'out.md')
+            with open(input_path, 'w', encoding='utf-8', newline='') as f:
+                f.write("20260105120000 Task One\r\nSimple Title\r\n20260105120001 Große Straße")
+
+            with patch.object(sys, 'argv', ['zid_name.py', '--input', input_path, '--output', output_path]):
+                zid_name.main()
+
+            with open(output_path, encoding='utf-8', newline='') as f:
+                self.assertEqual(f.read(), "20260105120000-task-one\r\nSimple Title\r\n20260105120001-grosse-strasse")
+
+        mock_paste.assert_not_called()
+        mock_copy.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import Slugifier, UniqueSlugs, process_lines_parallel, process_stream
+
+CONFIG = {
+    'slug_word_count': 2,
+    'process_non_zid_lines': True,
+    'preserve_extension_depth': 2,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+class TestUnique(unittest.TestCase):
+    """
+    Tests for collision-free batch output (UniqueSlugs, --unique).
+    """
+
+    def test_counter_before_extension(self):
+        unique = UniqueSlugs('-', extension_depth=2)
+        names = [unique.claim(name) for name in ["note.pdf", "note.pdf", "note.tar.gz", "note.tar.gz", "note.pdf"]]
+        self.assertEqual(names, ["note.pdf", "note-2.pdf", "note.tar.gz", "note-2.tar.gz", "note-3.pdf"])
+        self.assertEqual(unique.renamed, 3)
+
+    def test_generated_name_already_taken(self):
+        unique = UniqueSlugs('_', existing=["note", "note_2"])
+        self.assertEqual([unique.claim("note"), unique.claim("note"), unique.claim("note_3")],
+                         ["note_3", "note_4", "note_3_2"])
+
+    def test_existing_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            open(os.path.join(tmp, "weekly-plan.md"), 'w').close()
+            unique = Slugifier(CONFIG).unique_slugs(os.listdir(tmp))
+            self.assertEqual(unique.claim("weekly-plan.md"), "weekly-plan-2.md")
+            self.assertEqual(UniqueSlugs.for_directory(tmp).taken, {"weekly-plan.md"})
+
+    def test_slugify_many(self):
+        slugifier = Slugifier(CONFIG)
+        titles = ["Weekly Plan One.md", "Weekly Plan Two.md", "", "Weekly Plan.md", ""]
+        self.assertEqual(slugifier.slugify_many(titles, unique=slugifier.unique_slugs()),
+                         ["weekly-plan.md", "weekly-plan-2.md", "", "weekly-plan-3.md", ""])
+
+    def test_stream_leaves_skipped_lines(self):
+        lines = ["- [ ] 20260105120000 Task One\r\n", "- [ ] 20260105120000 Task One again\r\n",
+                 "\n", "\n", "weekly-plan\n", "Weekly Plan\n"]
+        result = list(process_stream(lines, CONFIG, Slugifier(CONFIG).unique_slugs()))
+        self.assertEqual(result, ["- [ ] 20260105120000-task-one\r\n", "- [ ] 20260105120000-task-one-2\r\n",
+                                  "\n", "\n", "weekly-plan\n", "weekly-plan-2\n"])
+
+        # Without process_non_zid_lines, only ZID lines are slugified and numbered
+        settings = dict(CONFIG, process_non_zid_lines=False)
+        lines = ["Comment\n", "Comment\n", "- [ ] 20260105120000-task-one\n", "- [ ] 20260105120000 Task One\n"]
+        self.assertEqual(list(process_stream(lines, settings, Slugifier(settings).unique_slugs())),
+                         ["Comment\n", "Comment\n", "- [ ] 20260105120000-task-one\n",
+                          "- [ ] 20260105120000-task-one-2\n"])
+
+    def test_lines_already_in_slug_form_are_claimed(self):
+        slugifier = Slugifier(CONFIG)
+        lines = ["note\n", "Note\n", "NOTE\n"]
+        expected = ["note\n", "note-2\n", "note-3\n"]
+        self.assertEqual(list(process_stream(lines, slugifier, slugifier.unique_slugs())), expected)
+        self.assertEqual(list(process_lines_parallel(lines, slugifier, jobs=2, chunk_size=1,
+                                                     unique=slugifier.unique_slugs())), expected)
+
+    def test_parallel_matches_stream(self):
+        lines = [f"Title {i % 7} Nummer {i}.md\n" for i in range(300)]
+        slugifier = Slugifier(CONFIG)
+        expected = list(process_stream(lines, slugifier, slugifier.unique_slugs()))
+        self.assertEqual(len(set(expected)), len(expected))
+        self.assertEqual(list(process_lines_parallel(lines, slugifier, jobs=2, chunk_size=17,
+                                                     unique=slugifier.unique_slugs())), expected)
+
+    @patch('zid_name.get_config', return_value=CONFIG)
+    def test_cli_unique_against(self, mock_get_config):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, 'in.txt')
+            output_path = os.path.join(tmp, 'out.txt')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write("Weekly Plan A.md\nWeekly Plan B.md\n")
+            existing = os.path.join(tmp, 'existing')
+            os.mkdir(existing)
+            open(os.path.join(existing, "weekly-plan.md"), 'w').close()
+
+            zid_name.main(['--input', input_path, '--output', output_path, '--unique-against', existing])
+            with open(output_path, encoding='utf-8') as f:
+                self.assertEqual(f.read(), "weekly-plan-2.md\nweekly-plan-3.md\n")
+
+        with patch('sys.stderr'), self.assertRaises(SystemExit):
+            zid_name.main(['--no-clipboard', '--unique', 'Title'])
+
+if __name__ == '__main__':
+    unittest.main()
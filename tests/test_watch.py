@@ -0,0 +1,149 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import Slugifier, load_vault_index, save_vault_index, scan_vault
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+class TestWatch(unittest.TestCase):
+    """
+    Tests for the incremental vault watcher (zid_name watch).
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.vault = self.tmp.name
+        self.slugifier = Slugifier(CONFIG)
+
+    def write(self, name, text):
+        path = os.path.join(self.vault, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        # Make sure the change is visible even on coarse mtime clocks
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def read(self, name):
+        with open(os.path.join(self.vault, name), encoding='utf-8', newline='') as f:
+            return f.read()
+
+    def test_incremental_passes(self):
+        self.write("note.md", "# Tasks\r\n- [ ] 20260105120000 Task One\r\nComment\r\n")
+        self.write(os.path.join("sub", "other.md"), "Nothing to do\n")
+        self.write("image.png", "20260105120000 Not Markdown\n")
+        index = {}
+
+        self.assertEqual(scan_vault(self.vault, index, self.slugifier), ["note.md"])
+        self.assertEqual(self.read("note.md"), "# Tasks\r\n- [ ] 20260105120000-task-one\r\nComment\r\n")
+        self.assertEqual(index["note.md"][3], (20260105120000,))
+
+        with patch.object(self.slugifier, 'process_line', wraps=self.slugifier.process_line) as spy:
+            # Unchanged files are not even read
+            self.assertEqual(scan_vault(self.vault, index, self.slugifier), [])
+            spy.assert_not_called()
+
+            # Only the new line of an edited file is processed
+            self.write("note.md", self.read("note.md") + "20260105120001 Große Straße\r\n")
+            self.assertEqual(scan_vault(self.vault, index, self.slugifier), ["note.md"])
+            spy.assert_called_once_with("20260105120001 Große Straße")
+
+        self.assertTrue(self.read("note.md").endswith("20260105120001-grosse-strasse\r\n"))
+
+        os.remove(os.path.join(self.vault, "sub", "other.md"))
+        scan_vault(self.vault, index, self.slugifier)
+        self.assertEqual(sorted(index), ["note.md"])
+
+    def test_index_persistence(self):
+        self.write("note.md", "20260105120000 Task One\n")
+        index = {}
+        scan_vault(self.vault, index, self.slugifier)
+
+        index_path = os.path.join(self.vault, zid_name.WATCH_INDEX_NAME)
+        save_vault_index(index_path, index, self.slugifier)
+        self.assertEqual(load_vault_index(index_path, self.slugifier), index)
+
+        # An index built with other settings is discarded
+        other = Slugifier(dict(CONFIG, slug_word_count=2))
+        self.assertEqual(load_vault_index(index_path, other), {})
+
+    def test_undecodable_note_is_skipped(self):
+        with open(os.path.join(self.vault, "latin1.md"), 'wb') as f:
+            f.write("20260105120000 Große Straße\n".encode('latin-1'))
+        self.write("note.md", "20260105120000 Task One\n")
+        index = {}
+
+        with patch('sys.stderr') as mock_stderr:
+            self.assertEqual(scan_vault(self.vault, index, self.slugifier), ["note.md"])
+            self.assertEqual(scan_vault(self.vault, index, self.slugifier), [])
+        reported = "".join(call.args[0] for call in mock_stderr.write.call_args_list)
+        self.assertEqual(reported.count("Skipped latin1.md"), 1)
+        self.assertIn("latin1.md", index)
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), "requires symlinks")
+    def test_symlinked_note_is_left_alone(self):
+        outside = tempfile.TemporaryDirectory()
+        self.addCleanup(outside.cleanup)
+        target = os.path.join(outside.name, "shared.md")
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write("20260105120000 Task One\n")
+        link = os.path.join(self.vault, "shared.md")
+        try:
+            os.symlink(target, link)
+        except OSError:
+            self.skipTest("cannot create symlinks")
+
+        self.assertEqual(scan_vault(self.vault, {}, self.slugifier), [])
+        self.assertTrue(os.path.islink(link))
+        with open(target, encoding='utf-8') as f:
+            self.assertEqual(f.read(), "20260105120000 Task One\n")
+
+    def test_edit_during_pass_is_kept(self):
+        self.write("note.md", "20260105120000 Task One\n")
+        slugifier = Slugifier(CONFIG)
+        process_line = slugifier.process_line
+
+        def edited_meanwhile(line, force_sanitize=False):
+            self.write("note.md", "20260105120000 Task One\nNew line typed by the user\n")
+            return process_line(line, force_sanitize)
+
+        slugifier.process_line = edited_meanwhile
+        index = {}
+        self.assertEqual(scan_vault(self.vault, index, slugifier), [])
+        self.assertEqual(self.read("note.md"), "20260105120000 Task One\nNew line typed by the user\n")
+        self.assertNotIn("note.md", index)
+
+        self.assertEqual(scan_vault(self.vault, index, self.slugifier), ["note.md"])
+        self.assertEqual(self.read("note.md"), "20260105120000-task-one\nNew line typed by the user\n")
+
+    def test_cli_once(self):
+        self.write("note.md", "20260105120000 Task One\n")
+        with patch('zid_name.get_config', return_value=CONFIG), patch('builtins.print'):
+            with self.assertRaises(SystemExit) as exit_info:
+                zid_name.main(['watch', self.vault, '--once'])
+        self.assertEqual(exit_info.exception.code, 0)
+        self.assertEqual(self.read("note.md"), "20260105120000-task-one\n")
+        self.assertTrue(os.path.exists(os.path.join(self.vault, zid_name.WATCH_INDEX_NAME)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import zid_name
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zid_name
+from zid_name import Slugifier, ZidIndex, build_zid_index
+
+CONFIG = {
+    'slug_word_count': 4,
+    'process_non_zid_lines': False,
+    'preserve_extension_depth': 0,
+    'slugify_extension_depth': 0,
+    'allowed_chars_regex': r'[^a-zA-Zа-яА-ЯёЁ0-9\s-]',
+    'lowercase': True,
+    'separator': '-',
+    'replacements': {
+         'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'ẞ': 'ss',
+         'Ä': 'ae', 'Ö': 'oe', 'Ü': 'ue', '_': '-', ':': '-', '.': '-'
+    }
+}
+
+class TestZidIndex(unittest.TestCase):
+    """
+    Tests for the ZID index (lookup, range queries, duplicates, file format).
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.vault = os.path.join(self.tmp.name, 'vault')
+        os.makedirs(self.vault)
+        self.write("20260105120000-project-notes.md",
+                   "# Project\n- [ ] 20260105120001 Task One\n- [x] 20260105120002-task-two\nComment\n")
+        self.write("20260104090000-ideas.md", "* 20260105120001 Große Straße\n")
+
+    def write(self, name, text):
+        with open(os.path.join(self.vault, name), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def build(self):
+        return build_zid_index([self.vault], Slugifier(CONFIG))
+
+    def test_lookup_range_and_dupes(self):
+        index = self.build()
+        self.assertEqual(len(index), 5)
+
+        notes = os.path.join(self.vault, "20260105120000-project-notes.md")
+        ideas = os.path.join(self.vault, "20260104090000-ideas.md")
+        self.assertEqual(index.lookup(20260105120000), [(20260105120000, "project-notes", notes, 0)])
+        self.assertEqual(index.lookup(20260105120002), [(20260105120002, "task-two", notes, 3)])
+        self.assertEqual(index.lookup(20991231000000), [])
+
+        self.assertEqual([record[0] for record in index.range(20260105000000, 20260105120001)],
+                         [20260105120000, 20260105120001, 20260105120001])
+        self.assertEqual(index.duplicates(), {
+            20260105120001: [(20260105120001, "grosse-strasse", ideas, 1),
+                             (20260105120001, "task-one", notes, 2)],
+        })
+
+    def test_note_heading_is_not_a_duplicate(self):
+        self.write("20260106080000 My Note.md", "# 20260106080000 My Note\n")
+        self.write("20260106090000 Other.md", "- 20260106090000 Other\n- 20260106090000 Again\n")
+        index = self.build()
+
+        note = os.path.join(self.vault, "20260106080000 My Note.md")
+        self.assertEqual(index.lookup(20260106080000), [(20260106080000, "my-note", note, 0),
+                                                        (20260106080000, "my-note", note, 1)])
+        self.assertEqual(list(index.duplicates()), [20260105120001])
+
+    def test_save_and_load(self):
+        index = self.build()
+        path = os.path.join(self.tmp.name, 'index.zidx')
+        index.save(path)
+
+        loaded = ZidIndex.load(path)
+        self.addCleanup(loaded.close)
+        self.assertEqual(list(loaded.zids), list(index.zids))
+        self.assertEqual(loaded.range(0, 99999999999999), index.range(0, 99999999999999))
+        self.assertEqual(loaded.duplicates(), index.duplicates())
+
+        # Adding to a loaded index keeps it sorted
+        loaded.add(20250101000000, "older", "other.md", 1)
+        self.assertEqual(loaded.range(0, 20251231999999), [(20250101000000, "older", "other.md", 1)])
+
+    def test_cli(self):
+        path = os.path.join(self.tmp.name, 'index.zidx')
+        with patch('zid_name.get_config', return_value=CONFIG), patch('builtins.print') as mock_print:
+            for argv, code in ((['index', '--index', path, 'build', self.vault], 0),
+                               (['index', '--index', path, 'query', '20260104'], 0),
+                               (['index', '--index', path, 'query', '--from', '2027'], 1),
+                               (['index', '--index', path, 'dupes'], 1)):
+                with self.assertRaises(SystemExit) as exit_info:
+                    zid_name.main(argv)
+                self.assertEqual(exit_info.exception.code, code, argv)
+
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        self.assertTrue(printed[1].startswith("20260104090000\t"))
+
+    def test_cli_errors(self):
+        missing = os.path.join(self.tmp.name, 'missing.zidx')
+        with patch('sys.stderr') as mock_stderr:
+            for argv, code in ((['index', 'query', 'abc'], 2),
+                               (['index', 'query', '--from', '2026-01'], 2),
+                               (['index', '--index', missing, 'query', '2026'], 1),
+                               (['index', '--index', missing, 'dupes'], 1),
+                               (['index', '--index', missing, 'build', missing], 1)):
+                with self.assertRaises(SystemExit) as exit_info:
+                    zid_name.main(argv)
+                self.assertEqual(exit_info.exception.code, code, argv)
+        reported = "".join(call.args[0] for call in mock_stderr.write.call_args_list)
+        self.assertIn("Not a ZID or ZID prefix: 'abc'", reported)
+        self.assertIn("Error:", reported)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+Frozen reference copy of the original zid_name slug pipeline.
+
+This is the implementation from before any performance work, kept verbatim
+(minus config loading and clipboard access, with process_string taking the
+settings dict explicitly). The differential harness (tests/differential.py)
+checks the optimized zid_name against it. Do not optimize or "fix" this file:
+behavior changes belong in zid_name.py and must be made here deliberately.
+"""
+import re
+
+def sanitizeName(inputString, cfg):
+    """
+    Sanitizes a string: keeps only the first N words (from config),
+    joins them with separator, and converts to lowercase.
+    This function corresponds to sanitizeName in Obsidian templates.
+    """
+    # 0. Handle Extensions
+    extension_suffix = ""
+    preserve_depth = cfg.get('preserve_extension_depth', 0)
+    slugify_depth = cfg.get('slugify_extension_depth', 0)
+
+    parts = inputString.split('.')
+    effective_level = 0
+
+    if preserve_depth > 0:
+        # Calculate effective nesting level: use the configured level,
+        # but ensure we leave at least one part for the stem (len(parts)-1).
+        # This allows "level=2" to work on "file.png" (treating it as level 1)
+        # while correctly handling "archive.tar.gz" as level 2.
+        effective_level = min(preserve_depth, len(parts) - 1)
+
+    elif slugify_depth > 0:
+        # User wants to force extension inclusion in the slug (hyphenated).
+        effective_level = min(slugify_depth, len(parts) - 1)
+
+    if effective_level > 0:
+        # Iterative check: try to find the longest valid suffix of extensions
+        # starting from the requested depth down to 1.
+        found_extensions = []
+        found_stem = []
+
+        for depth in range(effective_level, 0, -1):
+            potential_extensions = parts[-depth:]
+
+            # Constraint: Extensions typically do not contain spaces and are not empty.
+            if all(ext and not re.search(r'\s', ext) for ext in potential_extensions):
+                found_extensions = potential_extensions
+                found_stem = parts[:-depth]
+                break
+
+        if found_extensions:
+            # Reassemble stem so Step 1 can process it
+            inputString = ".".join(found_stem)
+
+            # Form the suffix
+            if preserve_depth > 0:
+                # Standard extension preservation: .ext
+                extension_suffix = "." + ".".join(found_extensions)
+            elif slugify_depth > 0:
+                # Slug mode: -ext
+                extension_suffix = cfg['separator'] + cfg['separator'].join(found_extensions)
+                if cfg['lowercase']:
+                    extension_suffix = extension_suffix.lower()
+
+    # 1. Character replacements
+    processedString = inputString
+    for char, replacement in cfg['replacements'].items():
+        processedString = processedString.replace(char, replacement)
+
+    # 2. Regex filtering
+    cleanedForSplitting = re.sub(cfg['allowed_chars_regex'], '', processedString)
+
+    # 3. Splitting and limiting
+    words = cleanedForSplitting.split()
+    firstWords = words[:cfg['slug_word_count']]
+
+    # 4. Joining with separator
+    finalName = cfg['separator'].join(firstWords)
+
+    # 4.5. Collapse multiple separators (clean up "--" to "-")
+    # This handles cases like "foo. bar" -> "foo- bar" -> "foo--bar" -> "foo-bar"
+    # treating ". " effectively as "-" without needing specific config for it.
+    if cfg['separator']:
+        finalName = re.sub(re.escape(cfg['separator']) + '+', cfg['separator'], finalName)
+
+    # 5. Remove trailing separators (new requirement)
+    finalName = finalName.rstrip(cfg['separator'])
+
+    # 6. Case conversion
+    if cfg['lowercase']:
+        finalName = finalName.lower()
+        extension_suffix = extension_suffix.lower()
+
+    return finalName + extension_suffix
+
+def process_line(line, cfg, force_sanitize=False):
+    """
+    Processes a single line: Detects ZID and handles word limit accordingly.
+    """
+    # Regex to detect ZID at the start (matching Obsidian template zidLineRegex)
+    # Group 1: Prefix (indentation, bullets, checkboxes)
+    # Group 2: ZID (14 digits)
+    # Group 3: Remaining text
+    zidLineRegex = r'^(\s*(?:(?:[-*+]|\d+\.)(?:\s+\[[ xX]\])?\s+|#{1,6}\s+)?)(\d{14})\s+(.*)$'
+    prefixOnlyRegex = r'^(\s*(?:(?:[-*+]|\d+\.)(?:\s+\[[ xX]\])?\s+|#{1,6}\s+))(.*)$'
+
+    zid_match = re.match(zidLineRegex, line)
+
+    if zid_match:
+        prefix = zid_match.group(1) or ""
+        zid = zid_match.group(2)
+        raw_text = zid_match.group(3)
+        safe_name = sanitizeName(raw_text, cfg)
+        return f"{prefix}{zid}{cfg['separator']}{safe_name}"
+    else:
+        # Check config to see if we should process non-ZID lines
+        # OR if we are forced to (single string selection case)
+        if force_sanitize:
+             return sanitizeName(line, cfg) if line.strip() else line
+
+        if cfg['process_non_zid_lines']:
+
+             # 2. Smart List Prefix Preservation (even if no ZID)
+             # If a line looks like a task/list item, preserve the prefix.
+             prefix_match = re.match(prefixOnlyRegex, line)
+             if prefix_match:
+                 prefix = prefix_match.group(1)
+                 raw_text = prefix_match.group(2)
+                 if raw_text.strip():
+                     return f"{prefix}{sanitizeName(raw_text, cfg)}"
+                 else:
+                     return line
+
+             # 3. Regular non-ZID, non-list, non-heading line
+             if line.strip():
+                return sanitizeName(line, cfg)
+             else:
+                return line
+        else:
+            return line
+
+def process_string(input_string, cfg):
+    """
+    Main processing logic: Handles batch processing for multi-line strings.
+    """
+    # "Smart" Detection:
+    # If it's a single line (no newlines), we assume it's a specific selection
+    # or a single title, so we ALWAYS sanitize it (legacy/substring support).
+    # If it's multi-line, we respect the process_non_zid_lines flag.
+
+    if "\n" not in input_string and "\r" not in input_string:
+        return process_line(input_string, cfg, force_sanitize=True)
+
+    lines = input_string.splitlines()
+    processed_lines = []
+
+    for line in lines:
+        processed_lines.append(process_line(line, cfg))
+
+    return "\n".join(processed_lines)
@@ -1,15 +1,174 @@
-import argparse
-import pyperclip
-import re
-import configparser
+import operator
 import os
+import re
+import sys
+import time
+import types
+
+# Regex to detect ZID at the start (matching Obsidian template zidLineRegex)
+# Group 1: Prefix (indentation, bullets, checkboxes)
+# Group 2: ZID (14 digits)
+# Group 3: Remaining text
+zidLineRegex = re.compile(r'^(\s*(?:(?:[-*+]|\d+\.)(?:\s+\[[ xX]\])?\s+|#{1,6}\s+)?)(\d{14})\s+(.*)$')
+prefixOnlyRegex = re.compile(r'^(\s*(?:(?:[-*+]|\d+\.)(?:\s+\[[ xX]\])?\s+|#{1,6}\s+))(.*)$')
+# Both of the above in one pass, as used by process_line:
+# Group 1: Prefix (indentation and marker), Group 2: Marker (None for indentation only)
+# Group 3: ZID (None if absent), Group 4: Remaining text
+lineRegex = re.compile(r'^(\s*((?:[-*+]|\d+\.)(?:\s+\[[ xX]\])?\s+|#{1,6}\s+)?)(?:(\d{14})\s+)?(.*)$')
+# ZID at the start of a line that may already be slugified ("20260105120000-task-one")
+zidStartRegex = re.compile(r'^\s*(?:(?:[-*+]|\d+\.)(?:\s+\[[ xX]\])?\s+|#{1,6}\s+)?(\d{14})(?!\d)')
+whitespaceRegex = re.compile(r'\s')
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.ini')
+
+# Parsed config.ini, keyed on the file's mtime (see get_config)
+_config_cache = {'mtime': None, 'settings': None, 'profiles': None}
+
+# Compiled Slugifier objects keyed on id() of their settings dict.
+# The dict itself is kept alongside so its id cannot be reused while cached.
+_slugifier_cache = {}
+# Sized to hold the config.ini profiles alongside a few ad-hoc settings dicts.
+_SLUGIFIER_CACHE_LIMIT = 32
+
+# Opt-in LRU cache of slugify results (see enable_cache)
+_slug_cache = None
+# Entry limit of a SlugCache created without any limit
+SLUG_CACHE_MAX_ENTRIES = 10000
+
+# Shared SlugStats while profiling is enabled (see enable_profiling)
+_slug_stats = None
+
+# Below this many [Replacements] entries the ordered str.replace loop beats a
+# str.translate table (see the "replacements" stage of benchmarks/bench_zid_name.py)
+TRANSLATE_MIN_REPLACEMENTS = 256
+
+# Titles per newline-joined batch in slugify_many
+SLUGIFY_BATCH_SIZE = 4096
+
+# Characters of input processed per chunk by Slugifier.process
+PROCESS_CHUNK_SIZE = 1 << 16
+
+# Lines per work item in process_lines_parallel
+PARALLEL_CHUNK_SIZE = 10000
+
+# Slugifier of a process_lines_parallel worker process (see _init_worker)
+_worker_slugifier = None
+
+# Async API: inputs batched in one event loop iteration are slugified on the loop
+# while their total length stays within this limit, otherwise in an executor.
+ASYNC_INLINE_LIMIT = 4096
+# Lines per executor job in aprocess_stream
+ASYNC_STREAM_BATCH = 1000
+
+# Shared AsyncSlugifier behind aslugify/aprocess/aprocess_stream
+_async_slugifier = None
+
+# Vault watcher (zid_name watch): per-vault index file and its format version
+WATCH_INDEX_NAME = '.zid-name-index'
+WATCH_INDEX_VERSION = 1
+WATCH_INTERVAL = 2.0
+
+# ZID index file (zid_name index): magic, then record count and records offset (little-endian u64)
+ZID_INDEX_MAGIC = b'ZIDIDX01'
+ZID_INDEX_FILE = 'zid-index.zidx'
+
+# Clipboard tools, as (paste command, copy command); see probe_clipboard
+CLIPBOARD_COMMANDS = {
+    'wl-clipboard': (['wl-paste', '--no-newline'], ['wl-copy']),
+    'xclip': (['xclip', '-selection', 'clipboard', '-o'], ['xclip', '-selection', 'clipboard']),
+    'xsel': (['xsel', '--clipboard', '--output'], ['xsel', '--clipboard', '--input']),
+    'pbcopy': (['pbpaste'], ['pbcopy']),
+}
+# Paste-tool errors that only mean the selection is empty (xclip, wl-paste)
+CLIPBOARD_EMPTY_ERRORS = ('not available', 'Nothing is copied', 'No selection', 'No suitable type of content')
+CLIPBOARD_ENV = 'ZID_NAME_CLIPBOARD'
+_clipboard = None
+
+# Named profiles: [profile:NAME] sections may set any of these keys
+PROFILE_SECTION_PREFIX = 'profile:'
+PROFILE_KEYS = {
+    'slug_word_count': int,
+    'process_non_zid_lines': bool,
+    'preserve_extension_depth': int,
+    'slugify_extension_depth': int,
+    'allowed_chars_regex': str,
+    'lowercase': bool,
+    'separator': str,
+}
+
+# Precompiled config (zid_name config compile): written next to config.ini and
+# used instead of parsing it while the INI file is unchanged
+CONFIG_SNAPSHOT_SUFFIX = '.snapshot'
+CONFIG_SNAPSHOT_VERSION = 2
+
+# Resident daemon (--serve / --client): localhost port used where Unix sockets are unavailable
+DAEMON_PORT = 47211
+DAEMON_TIMEOUT = 2.0
 
 def get_config():
-    """Reads all settings from config.ini."""
+    """
+    Reads all settings from config.ini, or from its compiled snapshot if that
+    is up to date (see compile_config_snapshot).
+    The parsed result is cached and only re-read when the file's mtime changes.
+    It is shared, so it is returned as a read-only mapping; use dict(...) for
+    a modifiable copy.
+    """
+    try:
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if _config_cache['settings'] is not None and _config_cache['mtime'] == mtime:
+        return _config_cache['settings']
+
+    loaded = load_config_snapshot(CONFIG_PATH) if mtime is not None else None
+    settings, profiles = loaded if loaded is not None else parse_config(CONFIG_PATH)
+    _config_cache['mtime'] = mtime
+    _config_cache['settings'] = _freeze_settings(settings)
+    _config_cache['profiles'] = types.MappingProxyType(
+        {name: _freeze_settings(profile) for name, profile in profiles.items()})
+    return _config_cache['settings']
+
+def _freeze_settings(settings):
+    """Read-only view of a settings dict (including its replacement map)."""
+    frozen = dict(settings)
+    frozen['replacements'] = types.MappingProxyType(dict(settings['replacements']))
+    return types.MappingProxyType(frozen)
+
+def get_profiles():
+    """
+    Returns {name: settings} for the [profile:NAME] sections of config.ini.
+    Cached together with get_config(), so the dicts keep their identity (and
+    their compiled Slugifier) until the file changes.
+    """
+    get_config()
+    return _config_cache['profiles'] or {}
+
+def get_profile(name):
+    """Returns the settings dict of a named profile; raises ValueError if it is not defined."""
+    try:
+        return get_profiles()[name]
+    except KeyError:
+        raise ValueError(f"Unknown config profile: {name!r}") from None
+
+def read_config(config_path):
+    """Parses a config.ini file into a settings dict (uncached)."""
+    return parse_config(config_path)[0]
+
+def parse_config(config_path, strict=False):
+    """
+    Parses a config.ini file into (settings, profiles), uncached.
+    A [profile:NAME] section overrides [Settings]/[Format] keys for that profile,
+    and an optional [profile:NAME:replacements] section replaces its replacement map.
+    Errors fall back to the defaults with a warning (an unknown key or bad value
+    in a profile section only drops that profile), unless strict is set: then
+    they are raised as ValueError and the settings are validated as well.
+    """
+    import configparser
+
     config = configparser.ConfigParser(delimiters=('=',))
     config.optionxform = str  # Preserve case for keys
-    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.ini')
-    
+
     defaults = {
         'slug_word_count': 4,
         'process_non_zid_lines': False,
@@ -25,11 +184,13 @@ def get_config():
     }
 
     if not os.path.exists(config_path):
-        return defaults
+        return defaults, {}
 
     try:
         config.read(config_path)
-        
+        if strict:
+            _check_config_values(config)
+
         settings = {
             'slug_word_count': config.getint('Settings', 'slug_word_count', fallback=defaults['slug_word_count']),
             'process_non_zid_lines': config.getboolean('Settings', 'process_non_zid_lines', fallback=defaults['process_non_zid_lines']),
@@ -46,183 +207,2152 @@ def get_config():
                 settings['replacements'][key] = value
         else:
             settings['replacements'] = defaults['replacements']
-            
-        return settings
+
+        profiles = {}
+        for section in config.sections():
+            if not section.startswith(PROFILE_SECTION_PREFIX) or section.endswith(':replacements'):
+                continue
+            name = section[len(PROFILE_SECTION_PREFIX):]
+            profile = dict(settings)
+            try:
+                for key in config[section]:
+                    if key not in PROFILE_KEYS:
+                        raise ValueError(f"Unknown key {key!r} in [{section}]")
+                    getter = {int: config.getint, bool: config.getboolean, str: config.get}[PROFILE_KEYS[key]]
+                    profile[key] = getter(section, key)
+            except ValueError as e:
+                if strict:
+                    raise
+                # A mistake in one profile only disables that profile
+                print(f"Warning: Ignoring profile {name!r} in config.ini. Error: {e}")
+                continue
+            if f"{section}:replacements" in config:
+                profile['replacements'] = dict(config[f"{section}:replacements"])
+            profiles[name] = profile
+
+        if strict:
+            validate_settings(settings)
+            for name, profile in profiles.items():
+                validate_settings(profile, f"[{PROFILE_SECTION_PREFIX}{name}]")
+        return settings, profiles
     except (configparser.Error, ValueError) as e:
+        if strict:
+            raise ValueError(str(e)) from e
         print(f"Warning: Error reading config.ini, using defaults. Error: {e}")
-        return defaults
+        return defaults, {}
+
+def _check_config_values(config):
+    """Raises ValueError naming the first unknown section, unknown key or unparsable value."""
+    for section in config.sections():
+        if section == 'Replacements' or (
+                section.startswith(PROFILE_SECTION_PREFIX) and section.endswith(':replacements')):
+            continue
+        if section not in ('Settings', 'Format') and not section.startswith(PROFILE_SECTION_PREFIX):
+            raise ValueError(f"Unknown section [{section}]")
+        for key in config[section]:
+            if key not in PROFILE_KEYS:
+                raise ValueError(f"Unknown key {key!r} in [{section}]")
+            getter = {int: config.getint, bool: config.getboolean, str: config.get}[PROFILE_KEYS[key]]
+            try:
+                getter(section, key)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for {key!r} in [{section}]: {e}") from None
+
+def validate_settings(settings, where="config.ini"):
+    """Raises ValueError for settings that parse but cannot work (such as an invalid regex)."""
+    if settings['slug_word_count'] < 1:
+        raise ValueError(f"{where}: slug_word_count must be at least 1")
+    for key in ('preserve_extension_depth', 'slugify_extension_depth'):
+        if settings[key] < 0:
+            raise ValueError(f"{where}: {key} must not be negative")
+    try:
+        re.compile(settings['allowed_chars_regex'])
+    except re.error as e:
+        raise ValueError(f"{where}: invalid allowed_chars_regex: {e}") from None
+
+def config_snapshot_path(config_path):
+    return config_path + CONFIG_SNAPSHOT_SUFFIX
+
+def compile_config_snapshot(config_path):
+    """
+    Parses and validates config_path and writes its snapshot, which get_config
+    then loads with marshal instead of running configparser.
+    Returns (snapshot path, hash of the INI content); raises ValueError if the
+    config is invalid, so mistakes show up here rather than as silent defaults.
+    """
+    import marshal
+
+    with open(config_path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        source_hash = _config_hash(f.read())
+    settings, profiles = parse_config(config_path, strict=True)
+
+    snapshot_path = config_snapshot_path(config_path)
+    data = {'version': CONFIG_SNAPSHOT_VERSION, 'source_mtime': stat.st_mtime_ns, 'source_size': stat.st_size,
+            'source_hash': source_hash, 'settings': settings, 'profiles': profiles}
+    _atomic_write(snapshot_path, marshal.dumps(data))
+    return snapshot_path, source_hash
+
+def _config_hash(data):
+    # zlib imports far faster than hashlib; this only detects edits, it is not a security check
+    import zlib
+
+    return f"{zlib.crc32(data):08x}"
+
+def load_config_snapshot(config_path):
+    """
+    Returns (settings, profiles) from the snapshot of config_path, or None if
+    there is none, it is from another version, or the INI file differs from
+    the one it was compiled from: mtime and size are compared first, then the
+    content hash (catching files replaced with their mtime kept, e.g. cp -p).
+    """
+    import marshal
 
+    try:
+        with open(config_snapshot_path(config_path), 'rb') as f:
+            data = marshal.load(f)
+        if not isinstance(data, dict) or data.get('version') != CONFIG_SNAPSHOT_VERSION:
+            return None
+        with open(config_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if (stat.st_mtime_ns, stat.st_size) != (data['source_mtime'], data['source_size']) \
+                    or _config_hash(f.read()) != data['source_hash']:
+                return None
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        return None
+    return data['settings'], data['profiles']
+
+# The clipboard backend is probed and imported on first use only, keeping CLI
+# start-up fast when the text is passed as an argument or the clipboard is disabled.
 def get_clipboard_text():
-    return pyperclip.paste()
+    return get_clipboard().paste()
 
 def set_clipboard_text(text):
-    pyperclip.copy(text)
+    get_clipboard().copy(text)
 
-def sanitizeName(inputString, cfg):
+class MemoryClipboard:
+    """In-process clipboard stand-in for headless runs and tests."""
+
+    name = 'memory'
+
+    def __init__(self, text=""):
+        self.text = text
+
+    def paste(self):
+        return self.text
+
+    def copy(self, text):
+        self.text = text
+
+class FileClipboard:
+    """Clipboard stand-in backed by a UTF-8 text file (missing file = empty clipboard)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = f"file:{path}"
+
+    def paste(self):
+        try:
+            with open(self.path, encoding='utf-8', newline='') as f:
+                return f.read()
+        except FileNotFoundError:
+            return ""
+
+    def copy(self, text):
+        with open(self.path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+
+class CommandClipboard:
     """
-    Sanitizes a string: keeps only the first N words (from config),
-    joins them with separator, and converts to lowercase.
-    This function corresponds to sanitizeName in Obsidian templates.
+    Clipboard driven by external tools (xclip, xsel, wl-clipboard, pbcopy).
+    The text always travels through the tools' stdin/stdout pipes, never argv
+    or the environment, so multi-megabyte selections are not size-limited.
     """
-    # 0. Handle Extensions
-    extension_suffix = ""
-    preserve_depth = cfg.get('preserve_extension_depth', 0)
-    slugify_depth = cfg.get('slugify_extension_depth', 0)
-    
-    parts = inputString.split('.')
-    effective_level = 0
-    
-    if preserve_depth > 0:
-        # Calculate effective nesting level: use the configured level, 
-        # but ensure we leave at least one part for the stem (len(parts)-1).
-        # This allows "level=2" to work on "file.png" (treating it as level 1)
-        # while correctly handling "archive.tar.gz" as level 2.
-        effective_level = min(preserve_depth, len(parts) - 1)
-    
-    elif slugify_depth > 0:
-        # User wants to force extension inclusion in the slug (hyphenated).
-        effective_level = min(slugify_depth, len(parts) - 1)
-
-    if effective_level > 0:
-        # Iterative check: try to find the longest valid suffix of extensions
-        # starting from the requested depth down to 1.
-        found_extensions = []
-        found_stem = []
-        
-        for depth in range(effective_level, 0, -1):
-            potential_extensions = parts[-depth:]
-            
-            # Constraint: Extensions typically do not contain spaces and are not empty.
-            if all(ext and not re.search(r'\s', ext) for ext in potential_extensions):
-                found_extensions = potential_extensions
-                found_stem = parts[:-depth]
-                break
-        
+
+    def __init__(self, name, paste_command, copy_command):
+        self.name = name
+        self.paste_command = paste_command
+        self.copy_command = copy_command
+
+    def paste(self):
+        import subprocess
+
+        result = subprocess.run(self.paste_command, stdin=subprocess.DEVNULL, capture_output=True)
+        if result.returncode != 0:
+            error = result.stderr.decode('utf-8', 'replace').strip()
+            # xclip and wl-paste fail on an empty clipboard; there is just nothing to paste then
+            if any(message in error for message in CLIPBOARD_EMPTY_ERRORS):
+                return ""
+            raise OSError(f"{self.name} exited with status {result.returncode}" + (f": {error}" if error else ""))
+        return result.stdout.decode('utf-8', 'replace')
+
+    def copy(self, text):
+        import subprocess
+
+        # The copy tools may fork to keep serving the selection, so their
+        # output must not be captured or the call would wait for that child.
+        process = subprocess.Popen(self.copy_command, stdin=subprocess.PIPE,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        process.communicate(text.encode('utf-8'))
+        if process.returncode != 0:
+            raise OSError(f"{self.name} exited with status {process.returncode}")
+
+class PyperclipClipboard:
+    """pyperclip, used where no pipe-based tool is available (e.g. Windows)."""
+
+    name = 'pyperclip'
+
+    def __init__(self):
+        import pyperclip
+
+        self.paste = pyperclip.paste
+        self.copy = pyperclip.copy
+
+def make_clipboard(name):
+    """Creates a clipboard backend by name: a CLIPBOARD_COMMANDS key, 'pyperclip', 'memory' or 'file:PATH'."""
+    if name == 'memory':
+        return MemoryClipboard()
+    if name.startswith('file:'):
+        return FileClipboard(name[len('file:'):])
+    if name == 'pyperclip':
+        return PyperclipClipboard()
+    if name in CLIPBOARD_COMMANDS:
+        return CommandClipboard(name, *CLIPBOARD_COMMANDS[name])
+    raise ValueError(f"Unknown clipboard backend: {name!r}")
+
+def probe_clipboard():
+    """
+    Picks the clipboard backend for this session: $ZID_NAME_CLIPBOARD if set,
+    otherwise the first installed pipe-based tool for the platform, otherwise pyperclip.
+    The X11 and Wayland tools are only considered inside such a session.
+    """
+    import shutil
+
+    requested = os.environ.get(CLIPBOARD_ENV)
+    if requested:
+        return make_clipboard(requested)
+
+    if sys.platform == 'darwin':
+        candidates = ['pbcopy']
+    elif os.name == 'nt':
+        candidates = []
+    else:
+        candidates = ['wl-clipboard'] if os.environ.get('WAYLAND_DISPLAY') else []
+        if os.environ.get('DISPLAY'):
+            candidates += ['xclip', 'xsel']
+
+    for name in candidates:
+        if all(shutil.which(command[0]) for command in CLIPBOARD_COMMANDS[name]):
+            return make_clipboard(name)
+    return PyperclipClipboard()
+
+def get_clipboard():
+    """Returns the clipboard backend, probing for one on first use only."""
+    global _clipboard
+    if _clipboard is None:
+        _clipboard = probe_clipboard()
+    return _clipboard
+
+def set_clipboard(backend):
+    """Installs a clipboard backend (e.g. MemoryClipboard()); None probes again on next use."""
+    global _clipboard
+    _clipboard = backend
+
+def compile_replacements(replacements):
+    """
+    Compiles the [Replacements] map into a replace function.
+
+    Usual maps use the ordered str.replace loop: str.replace returns the
+    string unchanged when the key does not occur, so a dozen keys cost less
+    than one str.translate pass. Only maps with at least
+    TRANSLATE_MIN_REPLACEMENTS entries (e.g. full transliteration tables) are
+    compiled into a single pass. Single-character keys become a str.translate
+    table; multi-character keys (e.g. '. ') become one alternation regex
+    applied before the table.
+
+    The result is identical to calling str.replace for each entry in order.
+    Maps where a single pass could differ (a value re-introducing key characters,
+    overlapping multi-character keys, empty keys) always use the ordered loop.
+    """
+    items = tuple(replacements.items())
+    if len(items) < TRANSLATE_MIN_REPLACEMENTS:
+        return _ordered_replacer(items)
+
+    key_chars = set("".join(key for key, _ in items))
+    value_chars = set("".join(value for _, value in items))
+    has_multi = any(len(key) > 1 for key, _ in items)
+
+    # Chained replacements: a later key could match text produced by an earlier one
+    # (or, for empty values, text joined around a removed character).
+    if any(not key for key, _ in items) or key_chars & value_chars \
+            or (has_multi and any(not value for _, value in items)):
+        return _ordered_replacer(items)
+
+    table = {}
+    multi = {}
+    for key, value in items:
+        if len(key) == 1:
+            table[ord(key)] = value
+        elif not any(ord(char) in table for char in key):
+            # Keys containing a character already replaced by an earlier
+            # single-character key can never match, so they are dropped.
+            multi[key] = value
+
+    # Overlapping multi-character keys depend on replacement order.
+    multi_keys = list(multi)
+    for a in multi_keys:
+        for b in multi_keys:
+            if a is not b and (a in b or any(a[-n:] == b[:n] for n in range(1, min(len(a), len(b))))):
+                return _ordered_replacer(items)
+
+    if not multi:
+        return lambda text: text.translate(table)
+
+    if len(multi) == 1:
+        ((key, value),) = multi.items()
+        return lambda text: text.replace(key, value).translate(table)
+
+    multiRegex = re.compile("|".join(re.escape(key) for key in multi_keys))
+    substitute = lambda match: multi[match.group()]
+    return lambda text: multiRegex.sub(substitute, text).translate(table)
+
+def _ordered_replacer(items):
+    def replace(text):
+        for char, replacement in items:
+            text = text.replace(char, replacement)
+        return text
+    return replace
+
+def config_fingerprint(settings):
+    """Returns a short stable hash of a settings dict."""
+    import hashlib
+
+    canonical = repr(sorted(
+        (key, tuple(value.items()) if isinstance(value, dict) else value)
+        for key, value in settings.items()
+    ))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).hexdigest()
+
+class SlugCache:
+    """
+    Bounded LRU cache for slugify results, keyed on (config fingerprint, input text),
+    so entries made under a different config are never returned.
+    Limited by entry count and/or approximate memory size in bytes; without
+    either limit, it holds SLUG_CACHE_MAX_ENTRIES entries.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        from collections import OrderedDict
+
+        if max_entries is None and max_bytes is None:
+            max_entries = SLUG_CACHE_MAX_ENTRIES
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_bytes = 0
+        self._entries = OrderedDict()
+
+    def wrap(self, slugifier):
+        """Returns a cached version of slugifier.slugify."""
+        slugify = type(slugifier).slugify.__get__(slugifier)
+        fingerprint = slugifier.fingerprint
+        entries = self._entries
+
+        def cached_slugify(inputString):
+            key = (fingerprint, inputString)
+            result = entries.get(key)
+            if result is not None:
+                self.hits += 1
+                try:
+                    entries.move_to_end(key)
+                except KeyError:
+                    pass
+                return result
+
+            self.misses += 1
+            result = slugify(inputString)
+            self._store(key, result)
+            return result
+
+        return cached_slugify
+
+    def _store(self, key, result):
+        entries = self._entries
+        size = sys.getsizeof(key[1]) + sys.getsizeof(result)
+        entries[key] = result
+        self.size_bytes += size
+
+        while entries and ((self.max_entries is not None and len(entries) > self.max_entries)
+                           or (self.max_bytes is not None and self.size_bytes > self.max_bytes)):
+            (_, text), evicted = entries.popitem(last=False)
+            self.size_bytes -= sys.getsizeof(text) + sys.getsizeof(evicted)
+            self.evictions += 1
+
+    def info(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.size_bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.size_bytes = 0
+
+class SlugStats:
+    """
+    Counters collected by ProfilingSlugifier: cumulative time and calls per
+    slugify stage, process_line classifications and input/output byte totals.
+    """
+
+    STAGES = ('extension', 'replacements', 'filter', 'split', 'collapse', 'lowercase', 'process_line')
+    LINE_KINDS = ('zid', 'prefix', 'plain', 'skipped')
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.stage_ns = dict.fromkeys(self.STAGES, 0)
+        self.stage_calls = dict.fromkeys(self.STAGES, 0)
+        self.lines = dict.fromkeys(self.LINE_KINDS, 0)
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def info(self):
+        return {
+            'stages': {stage: {'calls': self.stage_calls[stage], 'ns': self.stage_ns[stage]}
+                       for stage in self.STAGES},
+            'lines': dict(self.lines),
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+        }
+
+    def to_json(self):
+        import json
+
+        return json.dumps(self.info(), indent=2)
+
+    def summary(self):
+        """Flat-text table of the counters."""
+        rows = [f"{'stage':<13} {'calls':>10} {'total ms':>11} {'avg us':>9}"]
+        for stage in self.STAGES:
+            calls = self.stage_calls[stage]
+            ns = self.stage_ns[stage]
+            avg = ns / calls / 1000 if calls else 0.0
+            rows.append(f"{stage:<13} {calls:>10} {ns / 1e6:>11.3f} {avg:>9.3f}")
+        rows.append("lines: " + " ".join(f"{kind}={count}" for kind, count in self.lines.items()))
+        rows.append(f"bytes: in={self.bytes_in} out={self.bytes_out}")
+        return "\n".join(rows)
+
+class Slugifier:
+    """
+    Compiled slug engine built once from a settings dict (see get_config).
+    Config lookups and regexes are resolved up front, so slugify() and
+    process() can be called repeatedly without per-call setup.
+    """
+
+    def __init__(self, settings):
+        # A private copy, so later changes to the caller's dict cannot make
+        # self.settings (and the fingerprint) disagree with the compiled rules
+        settings = dict(settings, replacements=dict(settings['replacements']))
+        self.settings = settings
+        self.slug_word_count = settings['slug_word_count']
+        self.process_non_zid_lines = settings['process_non_zid_lines']
+        self.preserve_extension_depth = settings.get('preserve_extension_depth', 0)
+        self.slugify_extension_depth = settings.get('slugify_extension_depth', 0)
+        self.lowercase = settings['lowercase']
+        self.separator = settings['separator']
+        self.replaceChars = compile_replacements(settings['replacements'])
+        self.allowedCharsRegex = re.compile(settings['allowed_chars_regex'])
+        self.separatorRunRegex = re.compile(re.escape(self.separator) + '+') if self.separator else None
+        self.cache = None
+        self._fingerprint = None
+        # slugify_many joins batches with newlines, so they must survive the replacements
+        self._batchable = "\n" not in self.separator and not any(
+            "\n" in key or "\n" in value for key, value in settings['replacements'].items())
+
+    @property
+    def fingerprint(self):
+        """Stable hash of the settings this Slugifier was built from."""
+        if self._fingerprint is None:
+            self._fingerprint = config_fingerprint(self.settings)
+        return self._fingerprint
+
+    def set_cache(self, cache):
+        """Routes slugify() through a SlugCache, or removes the cache when given None."""
+        self.cache = cache
+        if cache is None:
+            self.__dict__.pop('slugify', None)
+        else:
+            self.slugify = cache.wrap(self)
+
+    def split_extension(self, inputString):
+        """
+        Splits configured file extensions off a name (Step 0 of slugify).
+        Returns the remaining stem and the suffix to append to the slug.
+        """
+        separator = self.separator
+        extension_suffix = ""
+        preserve_depth = self.preserve_extension_depth
+        slugify_depth = self.slugify_extension_depth
+
+        if preserve_depth > 0:
+            depth = preserve_depth
+        elif slugify_depth > 0:
+            # User wants to force extension inclusion in the slug (hyphenated).
+            depth = slugify_depth
+        else:
+            return inputString, extension_suffix
+
+        found_extensions, suffix_length = find_extensions(inputString, depth)
+
         if found_extensions:
-            # Reassemble stem so Step 1 can process it
-            inputString = ".".join(found_stem)
-            
+            # Cut off the stem so Step 1 can process it
+            inputString = inputString[:-suffix_length]
+
             # Form the suffix
             if preserve_depth > 0:
                 # Standard extension preservation: .ext
                 extension_suffix = "." + ".".join(found_extensions)
-            elif slugify_depth > 0:
+            else:
                 # Slug mode: -ext
-                extension_suffix = cfg['separator'] + cfg['separator'].join(found_extensions)
-                if cfg['lowercase']:
+                extension_suffix = separator + separator.join(found_extensions)
+                if self.lowercase:
                     extension_suffix = extension_suffix.lower()
 
-    # 1. Character replacements
-    processedString = inputString
-    for char, replacement in cfg['replacements'].items():
-        processedString = processedString.replace(char, replacement)
+        return inputString, extension_suffix
+
+    def slugify(self, inputString):
+        """
+        Sanitizes a string: keeps only the first N words (from config),
+        joins them with separator, and converts to lowercase.
+        This function corresponds to sanitizeName in Obsidian templates.
+        """
+        separator = self.separator
+
+        # 0. Handle Extensions
+        inputString, extension_suffix = self.split_extension(inputString)
+
+        # 1. Character replacements
+        processedString = self.replaceChars(inputString)
+
+        # 2. Regex filtering
+        cleanedForSplitting = self.allowedCharsRegex.sub('', processedString)
+
+        # 3. Splitting and limiting
+        words = cleanedForSplitting.split()
+        firstWords = words[:self.slug_word_count]
+
+        # 4. Joining with separator
+        finalName = separator.join(firstWords)
+
+        # 4.5. Collapse multiple separators (clean up "--" to "-")
+        # This handles cases like "foo. bar" -> "foo- bar" -> "foo--bar" -> "foo-bar"
+        # treating ". " effectively as "-" without needing specific config for it.
+        if self.separatorRunRegex is not None:
+            finalName = self.separatorRunRegex.sub(separator, finalName)
+
+        # 5. Remove trailing separators (new requirement)
+        finalName = finalName.rstrip(separator)
+
+        # 6. Case conversion
+        if self.lowercase:
+            finalName = finalName.lower()
+            extension_suffix = extension_suffix.lower()
+
+        return finalName + extension_suffix
+
+    def slugify_many(self, texts, dedupe=False, unique=None):
+        """
+        Slugifies a sequence of titles; the result equals [slugify(text) for text in texts].
+        Settings are bound once per batch, the character replacements run once over
+        each newline-joined batch, and with dedupe=True every distinct title is only
+        slugified once. With a UniqueSlugs, repeated non-empty slugs are numbered.
+        """
+        if not isinstance(texts, (list, tuple)):
+            texts = list(texts)
+
+        if unique is not None:
+            claim = unique.claim
+            return [claim(slug) if slug else slug for slug in self.slugify_many(texts, dedupe)]
+
+        if dedupe:
+            unique = list(dict.fromkeys(texts))
+            if len(unique) < len(texts):
+                slugs = dict(zip(unique, self.slugify_many(unique)))
+                return [slugs[text] for text in texts]
+
+        if self.cache is not None or not self._batchable:
+            slugify = self.slugify
+            return [slugify(text) for text in texts]
+
+        result = [None] * len(texts)
+        for start in range(0, len(texts), SLUGIFY_BATCH_SIZE):
+            batch = texts[start:start + SLUGIFY_BATCH_SIZE]
+            result[start:start + len(batch)] = self._slugify_batch(batch)
+        return result
+
+    def _slugify_batch(self, texts):
+        # Same steps as slugify(), with step 1 applied to the whole batch
+        separator = self.separator
+        if self.preserve_extension_depth > 0 or self.slugify_extension_depth > 0:
+            split_extension = self.split_extension
+            stems, suffixes = zip(*[split_extension(text) for text in texts])
+        else:
+            stems, suffixes = texts, None
+
+        joined = "\n".join(stems)
+        if joined.count("\n") != len(stems) - 1:
+            # A title contains a newline itself, so the batch cannot be split back
+            slugify = self.slugify
+            return [slugify(text) for text in texts]
+
+        removeDisallowed = self.allowedCharsRegex.sub
+        separatorRunRegex = self.separatorRunRegex
+        slug_word_count = self.slug_word_count
+        lowercase = self.lowercase
+        names = []
+        append = names.append
+        for processedString in self.replaceChars(joined).split("\n"):
+            finalName = separator.join(removeDisallowed('', processedString).split()[:slug_word_count])
+            if separatorRunRegex is not None:
+                finalName = separatorRunRegex.sub(separator, finalName)
+            finalName = finalName.rstrip(separator)
+            append(finalName.lower() if lowercase else finalName)
+
+        if suffixes is not None:
+            if lowercase:
+                suffixes = [suffix.lower() for suffix in suffixes]
+            names = [name + suffix for name, suffix in zip(names, suffixes)]
+        return names
+
+    def process_line(self, line, force_sanitize=False):
+        """
+        Processes a single line: Detects ZID and handles word limit accordingly.
+        """
+        # Cheap pre-check: a ZID or list/heading prefix starts (after indentation)
+        # with a digit or one of "-*+#", so most prose lines never reach the regex.
+        first = line[:1]
+        if first.isspace():
+            first = line.lstrip()[:1]
+        if first and (first in '-*+#' or first.isdecimal()):
+            line_match = lineRegex.match(line)
+        else:
+            line_match = None
+
+        if line_match is not None and line_match.group(3) is not None:
+            prefix = line_match.group(1)
+            zid = line_match.group(3)
+            raw_text = line_match.group(4)
+            safe_name = self.slugify(raw_text)
+            return f"{prefix}{zid}{self.separator}{safe_name}"
+        else:
+            # Check config to see if we should process non-ZID lines
+            # OR if we are forced to (single string selection case)
+            if force_sanitize:
+                 return self.slugify(line) if line.strip() else line
+
+            if self.process_non_zid_lines:
+
+                 # 2. Smart List Prefix Preservation (even if no ZID)
+                 # If a line looks like a task/list item, preserve the prefix.
+                 if line_match is not None and line_match.group(2) is not None:
+                     prefix = line_match.group(1)
+                     raw_text = line_match.group(4)
+                     if raw_text.strip():
+                         return f"{prefix}{self.slugify(raw_text)}"
+                     else:
+                         return line
+
+                 # 3. Regular non-ZID, non-list, non-heading line
+                 if line.strip():
+                    return self.slugify(line)
+                 else:
+                    return line
+            else:
+                return line
+
+    def classify_line(self, line, force_sanitize=False):
+        """Returns how process_line treats a line: 'zid', 'prefix', 'plain' or 'skipped'."""
+        # No match (e.g. an embedded line break) is a plain line, as in process_line
+        line_match = lineRegex.match(line)
+        if line_match is not None and line_match.group(3) is not None:
+            return 'zid'
+        if not line.strip():
+            return 'skipped'
+        if force_sanitize:
+            return 'plain'
+        if not self.process_non_zid_lines:
+            return 'skipped'
+        if line_match is not None and line_match.group(2) is not None:
+            return 'prefix' if line_match.group(4).strip() else 'skipped'
+        return 'plain'
+
+    def process(self, input_string):
+        """
+        Main processing logic: Handles batch processing for multi-line strings.
+        """
+        # "Smart" Detection:
+        # If it's a single line (no newlines), we assume it's a specific selection
+        # or a single title, so we ALWAYS sanitize it (legacy/substring support).
+        # If it's multi-line, we respect the process_non_zid_lines flag.
+
+        if "\n" not in input_string and "\r" not in input_string:
+            return self.process_line(input_string, force_sanitize=True)
+
+        # The input is processed in chunks, so only the result (and no list of
+        # all lines) is held in memory; an unchanged batch is returned as is.
+        chunks = list(self._process_chunks(input_string, passthrough=True))
+        if all(output is None for _, _, output in chunks):
+            return input_string[:chunks[-1][1]]
+        return "\n".join([input_string[start:end] if output is None else output for start, end, output in chunks])
+
+    def process_into(self, input_string, target, passthrough=False):
+        """
+        Writes the batch result of process() for multi-line input to target
+        (anything with write(), e.g. io.StringIO or a text file) chunk by chunk,
+        without holding all lines or the whole result in memory. With
+        passthrough=True, chunks without changes are written as slices of the input.
+        """
+        write = target.write
+        separator = ""
+        for start, end, output in self._process_chunks(input_string, passthrough):
+            write(separator)
+            write(input_string[start:end] if output is None else output)
+            separator = "\n"
+
+    def _process_chunks(self, input_string, passthrough):
+        # Yields the output of process() in pieces to be joined with "\n", as
+        # (start, end, output) per chunk of about PROCESS_CHUNK_SIZE characters.
+        # Chunks are cut after a "\n", so splitlines() of the chunks equals
+        # splitlines() of the whole input. In passthrough mode, output is None
+        # when the chunk's output is input_string[start:end] itself.
+        process_line = self.process_line
+        size = len(input_string)
+        start = 0
+        while start < size:
+            end = input_string.find("\n", start + PROCESS_CHUNK_SIZE) + 1 or size
+            chunk = input_string[start:end]
+            lines = chunk.splitlines()
+            results = [process_line(line) for line in lines]
+
+            if passthrough and all(map(operator.is_, results, lines)):
+                # Unchanged lines separated by plain "\n": the input already is the output
+                output_end = end - 1 if chunk.endswith("\n") else end
+                breaks = len(lines) - 1
+                if "\r" not in chunk and output_end - start == sum(map(len, lines)) + breaks \
+                        and input_string.count("\n", start, output_end) == breaks:
+                    yield start, output_end, None
+                    start = end
+                    continue
+            yield start, end, "\n".join(results)
+            start = end
+
+    def process_stream(self, lines, unique=None):
+        """
+        Generator version of process() for batch input of any size.
+        Lines are consumed one at a time (e.g. from a file opened with newline='')
+        and yielded with their original line endings ('\r\n', '\n' or '\r') intact.
+        With a UniqueSlugs (see unique_slugs), every line that goes through the slug
+        rules is made unique, including lines already in slug form; skipped lines
+        (see classify_line) without a ZID pass through as they are.
+        """
+        process_line = self.process_line
+        if unique is None:
+            for line in lines:
+                text, ending = split_line_ending(line)
+                yield process_line(text) + ending
+            return
+
+        claim = unique.claim
+        is_slug_line = self._is_slug_line
+        for line in lines:
+            text, ending = split_line_ending(line)
+            result = process_line(text)
+            yield (claim(result) if is_slug_line(text) else result) + ending
+
+    def _is_slug_line(self, line):
+        # Lines --unique numbers: everything the slug rules apply to, plus ZID
+        # lines already in slug form ("- [ ] 20260105120000-task-one")
+        return self.classify_line(line) != 'skipped' or zidStartRegex.match(line) is not None
+
+    def unique_slugs(self, existing=()):
+        """Returns a UniqueSlugs using this Slugifier's separator and preserved extensions."""
+        return UniqueSlugs(self.separator, self.preserve_extension_depth, existing)
+
+class ProfilingSlugifier(Slugifier):
+    """
+    Slugifier that records timings and counters into a SlugStats.
+    A separate class, so the plain Slugifier hot path carries no instrumentation.
+    """
+
+    def __init__(self, settings, stats):
+        super().__init__(settings)
+        self.stats = stats
+        # Batches would bypass the per-stage timings in slugify()
+        self._batchable = False
+
+    def slugify(self, inputString):
+        clock = time.perf_counter_ns
+        stage_ns = self.stats.stage_ns
+        stage_calls = self.stats.stage_calls
+        separator = self.separator
+
+        t0 = clock()
+        inputString, extension_suffix = self.split_extension(inputString)
+        t1 = clock()
+        processedString = self.replaceChars(inputString)
+        t2 = clock()
+        cleanedForSplitting = self.allowedCharsRegex.sub('', processedString)
+        t3 = clock()
+        finalName = separator.join(cleanedForSplitting.split()[:self.slug_word_count])
+        t4 = clock()
+        if self.separatorRunRegex is not None:
+            finalName = self.separatorRunRegex.sub(separator, finalName)
+        finalName = finalName.rstrip(separator)
+        t5 = clock()
+        if self.lowercase:
+            finalName = finalName.lower()
+            extension_suffix = extension_suffix.lower()
+        t6 = clock()
+
+        for stage, ns in (('extension', t1 - t0), ('replacements', t2 - t1), ('filter', t3 - t2),
+                          ('split', t4 - t3), ('collapse', t5 - t4), ('lowercase', t6 - t5)):
+            stage_ns[stage] += ns
+            stage_calls[stage] += 1
+        return finalName + extension_suffix
+
+    def process_line(self, line, force_sanitize=False):
+        stats = self.stats
+        t0 = time.perf_counter_ns()
+        result = Slugifier.process_line(self, line, force_sanitize)
+        stats.stage_ns['process_line'] += time.perf_counter_ns() - t0
+        stats.stage_calls['process_line'] += 1
+        stats.lines[self.classify_line(line, force_sanitize)] += 1
+        return result
+
+    def process(self, input_string):
+        result = Slugifier.process(self, input_string)
+        self.stats.bytes_in += len(input_string.encode('utf-8', 'surrogatepass'))
+        self.stats.bytes_out += len(result.encode('utf-8', 'surrogatepass'))
+        return result
+
+    def process_stream(self, lines, unique=None):
+        stats = self.stats
+
+        def counted(lines):
+            for line in lines:
+                stats.bytes_in += len(line.encode('utf-8', 'surrogatepass'))
+                yield line
+
+        for result in Slugifier.process_stream(self, counted(lines), unique):
+            stats.bytes_out += len(result.encode('utf-8', 'surrogatepass'))
+            yield result
+
+def find_extensions(name, depth):
+    """
+    Returns (extensions, suffix_length) for the longest valid run of up to
+    `depth` extensions at the end of name, e.g. (['tar', 'gz'], 7).
+    """
+    # Only the last `depth` dots can start an extension. rsplit also caps the
+    # effective level so at least one part is left for the stem: "level=2"
+    # works on "file.png" (treated as level 1) and on "archive.tar.gz".
+    parts = name.rsplit('.', depth)
+
+    # Find the longest valid suffix of extensions by scanning right to left.
+    # Constraint: Extensions typically do not contain spaces and are not empty.
+    found = 0
+    suffix_length = 0
+    for ext in reversed(parts[1:]):
+        if not ext or whitespaceRegex.search(ext):
+            break
+        found += 1
+        suffix_length += len(ext) + 1
+    return (parts[-found:] if found else []), suffix_length
+
+class UniqueSlugs:
+    """
+    Hands out collision-free names for a batch. The first occurrence of a slug
+    is kept, later ones get a counter before the preserved extension
+    ("note-2.pdf", "note-3.pdf"). Names in `existing` (e.g. a directory listing
+    read once) count as taken. Results depend only on the input order, and each
+    claim is a set lookup; the last counter per slug is remembered, so repeated
+    duplicates do not rescan.
+    """
+
+    def __init__(self, separator='-', extension_depth=0, existing=()):
+        self.separator = separator
+        self.extension_depth = extension_depth
+        self.taken = set(existing)
+        self.renamed = 0
+        self._counters = {}
+
+    @classmethod
+    def for_directory(cls, path, separator='-', extension_depth=0):
+        """UniqueSlugs that also avoids every name already present in directory path."""
+        return cls(separator, extension_depth, os.listdir(path))
+
+    def claim(self, slug):
+        """Returns slug, or a numbered variant of it if slug was already handed out or taken."""
+        if slug not in self.taken:
+            self.taken.add(slug)
+            return slug
+
+        suffix_length = find_extensions(slug, self.extension_depth)[1] if self.extension_depth > 0 else 0
+        stem, suffix = slug[:len(slug) - suffix_length], slug[len(slug) - suffix_length:]
+        counter = self._counters.get(slug, 1)
+        while True:
+            counter += 1
+            candidate = f"{stem}{self.separator}{counter}{suffix}"
+            if candidate not in self.taken:
+                break
+        self._counters[slug] = counter
+        self.taken.add(candidate)
+        self.renamed += 1
+        return candidate
+
+def split_line_ending(line):
+    """Splits a line read with newline='' into its text and its line ending."""
+    if line.endswith('\n'):
+        if line.endswith('\r\n'):
+            return line[:-2], '\r\n'
+        return line[:-1], '\n'
+    if line.endswith('\r'):
+        return line[:-1], '\r'
+    return line, ''
+
+def compile_config(cfg):
+    """
+    Returns the Slugifier for a settings dict, compiling it on first use.
+    Passing a Slugifier returns it unchanged; a string selects a config.ini profile.
+    A dict that was modified in place since it was compiled is compiled again.
+    """
+    if isinstance(cfg, Slugifier):
+        return cfg
+    if isinstance(cfg, str):
+        cfg = get_profile(cfg)
+
+    cached = _slugifier_cache.get(id(cfg))
+    # The read-only get_config()/get_profiles() mappings cannot change, so only
+    # other mappings are compared against the settings they were compiled from
+    if cached is not None and cached[0] is cfg and (
+            type(cfg) is types.MappingProxyType or cached[1].settings == cfg):
+        return cached[1]
+
+    slugifier = Slugifier(cfg) if _slug_stats is None else ProfilingSlugifier(cfg, _slug_stats)
+    if _slug_cache is not None:
+        slugifier.set_cache(_slug_cache)
+    if len(_slugifier_cache) >= _SLUGIFIER_CACHE_LIMIT:
+        _slugifier_cache.clear()
+    _slugifier_cache[id(cfg)] = (cfg, slugifier)
+    return slugifier
+
+def get_slugifier(profile=None):
+    """
+    Returns the Slugifier for config.ini (or one of its named profiles),
+    rebuilt only when the file changes.
+    """
+    return compile_config(get_config() if profile is None else get_profile(profile))
+
+def enable_cache(max_entries=None, max_bytes=None):
+    """
+    Enables a shared LRU cache for sanitizeName/process_line/process_string results,
+    bounded by entry count and/or bytes (SLUG_CACHE_MAX_ENTRIES entries if neither
+    is given). Replaces any previously enabled cache.
+    """
+    global _slug_cache
+    _slug_cache = SlugCache(max_entries, max_bytes)
+    for _, slugifier in _slugifier_cache.values():
+        slugifier.set_cache(_slug_cache)
+    return _slug_cache
+
+def disable_cache():
+    global _slug_cache
+    _slug_cache = None
+    for _, slugifier in _slugifier_cache.values():
+        slugifier.set_cache(None)
+
+def cache_info():
+    """Returns hit/miss/eviction counters and size of the shared cache, or None if disabled."""
+    return _slug_cache.info() if _slug_cache is not None else None
+
+def cache_clear():
+    if _slug_cache is not None:
+        _slug_cache.clear()
+
+def enable_profiling():
+    """
+    Routes sanitizeName/process_line/process_string and the streaming functions
+    through ProfilingSlugifier and returns the shared SlugStats.
+    """
+    global _slug_stats
+    if _slug_stats is None:
+        _slug_stats = SlugStats()
+        _slugifier_cache.clear()
+    return _slug_stats
+
+def disable_profiling():
+    global _slug_stats
+    _slug_stats = None
+    _slugifier_cache.clear()
+
+def profile_stats():
+    """Returns the collected counters as a dict, or None if profiling is disabled."""
+    return _slug_stats.info() if _slug_stats is not None else None
+
+def slugify_many(texts, cfg=None, dedupe=False, unique=None):
+    """
+    Batch sanitizeName for lists of titles (see Slugifier.slugify_many).
+    Uses the config.ini settings unless cfg (settings dict or Slugifier) is given.
+    """
+    slugifier = get_slugifier() if cfg is None else compile_config(cfg)
+    return slugifier.slugify_many(texts, dedupe, unique)
 
-    # 2. Regex filtering
-    cleanedForSplitting = re.sub(cfg['allowed_chars_regex'], '', processedString)
+def slugify_array(values, cfg=None, dedupe=True):
+    """
+    slugify_many for NumPy arrays and pandas Series/Index objects.
+    Returns an object array, or a Series with the original index and name.
+    Non-string items (None, NaN) are passed through unchanged.
+    """
+    items = values.tolist()
+    positions = [i for i, item in enumerate(items) if isinstance(item, str)]
+    slugs = slugify_many([items[i] for i in positions], cfg, dedupe)
+    for i, slug in zip(positions, slugs):
+        items[i] = slug
 
-    # 3. Splitting and limiting
-    words = cleanedForSplitting.split()
-    firstWords = words[:cfg['slug_word_count']]
+    if hasattr(values, 'index') and hasattr(values, 'name'):
+        import pandas
 
-    # 4. Joining with separator
-    finalName = cfg['separator'].join(firstWords)
-    
-    # 4.5. Collapse multiple separators (clean up "--" to "-")
-    # This handles cases like "foo. bar" -> "foo- bar" -> "foo--bar" -> "foo-bar"
-    # treating ". " effectively as "-" without needing specific config for it.
-    if cfg['separator']:
-        finalName = re.sub(re.escape(cfg['separator']) + '+', cfg['separator'], finalName)
+        if isinstance(values, pandas.Index):
+            return pandas.Index(items, dtype=object, name=values.name)
+        return pandas.Series(items, index=values.index, name=values.name, dtype=object)
 
-    # 5. Remove trailing separators (new requirement)
-    finalName = finalName.rstrip(cfg['separator'])
+    import numpy
 
-    # 6. Case conversion
-    if cfg['lowercase']:
-        finalName = finalName.lower()
-        extension_suffix = extension_suffix.lower()
+    result = numpy.empty(len(items), dtype=object)
+    result[:] = items
+    return result.reshape(values.shape)
 
-    return finalName + extension_suffix
+def sanitizeName(inputString, cfg):
+    """
+    Sanitizes a string: keeps only the first N words (from config),
+    joins them with separator, and converts to lowercase.
+    This function corresponds to sanitizeName in Obsidian templates.
+    """
+    return compile_config(cfg).slugify(inputString)
 
 def process_line(line, cfg, force_sanitize=False):
     """
     Processes a single line: Detects ZID and handles word limit accordingly.
     """
-    # Regex to detect ZID at the start (matching Obsidian template zidLineRegex)
-    # Group 1: Prefix (indentation, bullets, checkboxes)
-    # Group 2: ZID (14 digits)
-    # Group 3: Remaining text
-    zidLineRegex = r'^(\s*(?:(?:[-*+]|\d+\.)(?:\s+\[[ xX]\])?\s+|#{1,6}\s+)?)(\d{14})\s+(.*)$'
-    prefixOnlyRegex = r'^(\s*(?:(?:[-*+]|\d+\.)(?:\s+\[[ xX]\])?\s+|#{1,6}\s+))(.*)$'
-    
-    zid_match = re.match(zidLineRegex, line)
-    
-    if zid_match:
-        prefix = zid_match.group(1) or ""
-        zid = zid_match.group(2)
-        raw_text = zid_match.group(3)
-        safe_name = sanitizeName(raw_text, cfg)
-        return f"{prefix}{zid}{cfg['separator']}{safe_name}"
-    else:
-        # Check config to see if we should process non-ZID lines
-        # OR if we are forced to (single string selection case)
-        if force_sanitize:
-             return sanitizeName(line, cfg) if line.strip() else line
-        
-        if cfg['process_non_zid_lines']:
-             
-             # 2. Smart List Prefix Preservation (even if no ZID)
-             # If a line looks like a task/list item, preserve the prefix.
-             prefix_match = re.match(prefixOnlyRegex, line)
-             if prefix_match:
-                 prefix = prefix_match.group(1)
-                 raw_text = prefix_match.group(2)
-                 if raw_text.strip():
-                     return f"{prefix}{sanitizeName(raw_text, cfg)}"
-                 else:
-                     return line
-             
-             # 3. Regular non-ZID, non-list, non-heading line
-             if line.strip():
-                return sanitizeName(line, cfg)
-             else:
-                return line
-        else:
-            return line
+    return compile_config(cfg).process_line(line, force_sanitize)
 
-def process_string(input_string):
+def process_string(input_string, profile=None):
     """
     Main processing logic: Handles batch processing for multi-line strings.
+    Uses the named config.ini profile if one is given.
     """
-    cfg = get_config()
-    
-    # "Smart" Detection:
-    # If it's a single line (no newlines), we assume it's a specific selection 
-    # or a single title, so we ALWAYS sanitize it (legacy/substring support).
-    # If it's multi-line, we respect the process_non_zid_lines flag.
-    
-    if "\n" not in input_string and "\r" not in input_string:
-        return process_line(input_string, cfg, force_sanitize=True)
-    
-    lines = input_string.splitlines()
-    processed_lines = []
-    
-    for line in lines:
-        processed_lines.append(process_line(line, cfg))
-                     
-    return "\n".join(processed_lines)
-
-def main():
-    parser = argparse.ArgumentParser(description="Process string for a filename based on config.ini settings (ZID aware).")
+    return get_slugifier(profile).process(input_string)
+
+def process_stream(lines, cfg=None, unique=None):
+    """
+    Streams lines through process_line, preserving each line's ending.
+    Uses the config.ini settings unless cfg (settings dict or Slugifier) is given.
+    Pass a UniqueSlugs to number repeated slugs (see Slugifier.process_stream).
+    """
+    slugifier = get_slugifier() if cfg is None else compile_config(cfg)
+    return slugifier.process_stream(lines, unique)
+
+def process_lines_parallel(lines, cfg=None, jobs=None, chunk_size=PARALLEL_CHUNK_SIZE, unique=None):
+    """
+    Parallel version of process_stream for very large batches.
+    Lines are sharded into chunks of chunk_size and slugified in a pool of `jobs`
+    worker processes (default: one per CPU), each compiling the settings once.
+    Results are yielded in input order; at most 2 * jobs chunks are in flight,
+    so memory stays bounded for inputs of any length. With a UniqueSlugs, repeated
+    slugs are numbered here in the parent, in input order, so the result is the
+    same as with process_stream.
+    """
+    slugifier = get_slugifier() if cfg is None else compile_config(cfg)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1:
+        yield from slugifier.process_stream(lines, unique)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import islice
+
+    def results(chunk, future):
+        if unique is None:
+            return future.result()
+        return _claim_processed(unique, slugifier._is_slug_line, chunk, future.result())
+
+    # Workers keep their own cache with the same limits as the shared one
+    cache_limits = (_slug_cache.max_entries, _slug_cache.max_bytes) if _slug_cache is not None else None
+    lines = iter(lines)
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(slugifier.settings, cache_limits)) as executor:
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                break
+            pending.append((chunk, executor.submit(_process_chunk, chunk)))
+            if len(pending) >= 2 * jobs:
+                yield from results(*pending.popleft())
+        while pending:
+            yield from results(*pending.popleft())
+
+def _claim_processed(unique, is_slug_line, lines, results):
+    # Same rule as Slugifier.process_stream, applied to the workers' results
+    claim = unique.claim
+    for line, result in zip(lines, results):
+        if is_slug_line(split_line_ending(line)[0]):
+            text, ending = split_line_ending(result)
+            result = claim(text) + ending
+        yield result
+
+def _init_worker(settings, cache_limits=None):
+    global _worker_slugifier
+    _worker_slugifier = Slugifier(settings)
+    if cache_limits is not None:
+        _worker_slugifier.set_cache(SlugCache(*cache_limits))
+
+def _process_chunk(lines):
+    return _collect_stream(_worker_slugifier, lines)
+
+class AsyncSlugifier:
+    """
+    asyncio front end for a Slugifier (settings dict, Slugifier or config.ini).
+    The config is loaded off-loop once, on first use. Small requests issued in
+    the same loop iteration are slugified together in a single callback, while
+    large batches and stream chunks run in an executor so the loop never stalls.
+    """
+
+    def __init__(self, cfg=None, executor=None):
+        self.cfg = cfg
+        self.executor = executor
+        self._slugifier = None
+        self._pending = []
+        self._pending_size = 0
+
+    async def get_slugifier(self):
+        if self._slugifier is None:
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            if self.cfg is None:
+                self._slugifier = await loop.run_in_executor(self.executor, get_slugifier)
+            else:
+                self._slugifier = await loop.run_in_executor(self.executor, compile_config, self.cfg)
+        return self._slugifier
+
+    def reload(self):
+        """Drops the loaded config; the next request loads it again."""
+        self._slugifier = None
+
+    async def slugify(self, text):
+        slugifier = await self.get_slugifier()
+        return await self._submit(slugifier.slugify, text)
+
+    async def process(self, text):
+        slugifier = await self.get_slugifier()
+        return await self._submit(slugifier.process, text)
+
+    async def process_stream(self, lines, batch_size=ASYNC_STREAM_BATCH):
+        """
+        Async generator version of process_stream for an async iterable of lines.
+        Lines are read in batches only as results are consumed (backpressure),
+        and each batch is processed in the executor.
+        """
+        import asyncio
+
+        slugifier = await self.get_slugifier()
+        loop = asyncio.get_running_loop()
+        batch = []
+        async for line in lines:
+            batch.append(line)
+            if len(batch) >= batch_size:
+                for result in await loop.run_in_executor(self.executor, _collect_stream, slugifier, batch):
+                    yield result
+                batch = []
+        if batch:
+            for result in await loop.run_in_executor(self.executor, _collect_stream, slugifier, batch):
+                yield result
+
+    def _submit(self, func, text):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._pending:
+            loop.call_soon(self._flush, loop)
+        self._pending.append((future, func, text))
+        self._pending_size += len(text)
+        return future
+
+    def _flush(self, loop):
+        batch, self._pending = self._pending, []
+        size, self._pending_size = self._pending_size, 0
+        if size <= ASYNC_INLINE_LIMIT:
+            _resolve_batch(batch, _run_batch(batch))
+        else:
+            done = loop.run_in_executor(self.executor, _run_batch, batch)
+            done.add_done_callback(lambda done: _resolve_batch(batch, done.result()))
+
+def _run_batch(batch):
+    results = []
+    for _, func, text in batch:
+        try:
+            results.append((True, func(text)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+def _resolve_batch(batch, results):
+    for (future, _, _), (ok, value) in zip(batch, results):
+        if future.done():
+            continue
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+
+def _collect_stream(slugifier, lines):
+    return list(slugifier.process_stream(lines))
+
+def _get_async_slugifier():
+    global _async_slugifier
+    if _async_slugifier is None:
+        _async_slugifier = AsyncSlugifier()
+    return _async_slugifier
+
+async def aslugify(text):
+    """Async sanitizeName using the config.ini settings (see AsyncSlugifier)."""
+    return await _get_async_slugifier().slugify(text)
+
+async def aprocess(text):
+    """Async process_string using the config.ini settings (see AsyncSlugifier)."""
+    return await _get_async_slugifier().process(text)
+
+def aprocess_stream(lines, batch_size=ASYNC_STREAM_BATCH):
+    """Async process_stream over an async iterable of lines (see AsyncSlugifier)."""
+    return _get_async_slugifier().process_stream(lines, batch_size)
+
+def open_text(path, mode):
+    """Opens a UTF-8 text file ('-' for stdin/stdout) without newline translation."""
+    if path == '-':
+        stream = sys.stdin if 'r' in mode else sys.stdout
+        stream.flush()
+        return open(stream.fileno(), mode, encoding='utf-8', newline='', closefd=False)
+    return open(path, mode, encoding='utf-8', newline='')
+
+def run_stream(input_path, output_path, jobs=1, profile=None, unique=False, existing_dir=None):
+    """
+    Streams input_path to output_path line by line ('-' means stdin/stdout).
+    With unique, repeated slugs are numbered; existing_dir adds the names in
+    that directory (listed once) to the names that are already taken.
+    """
+    slugifier = get_slugifier(profile)
+    slugs = None
+    if unique or existing_dir is not None:
+        slugs = slugifier.unique_slugs(os.listdir(existing_dir) if existing_dir is not None else ())
+    with open_text(input_path, 'r') as source, open_text(output_path, 'w') as target:
+        if jobs == 1:
+            target.writelines(process_stream(source, slugifier, slugs))
+        else:
+            target.writelines(process_lines_parallel(source, slugifier, jobs=jobs, unique=slugs))
+
+def daemon_address(socket_path=None, port=None):
+    """
+    Resolves the daemon address: a Unix socket path, or a (host, port) tuple for
+    localhost TCP. Defaults to a per-user socket where Unix sockets are available.
+    """
+    import socket
+
+    if port is not None:
+        return ('127.0.0.1', port)
+    if socket_path is not None:
+        return socket_path
+    if hasattr(socket, 'AF_UNIX'):
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+        return os.path.join(runtime_dir, f"zid-name-{os.getuid()}.sock")
+    return ('127.0.0.1', DAEMON_PORT)
+
+def daemon_token_path(port):
+    """
+    Per-user file holding the secret of a TCP daemon. Any local user can
+    connect to a localhost port, so TCP client and daemon prove to each other
+    that they know this secret before any text is sent (see make_server).
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or os.path.expanduser('~')
+    return os.path.join(runtime_dir, f".zid-name-{port}.token")
+
+def _daemon_proof(token, role, nonce):
+    import hmac
+
+    return hmac.new(token.encode('ascii'), f"{role}:{nonce}".encode('utf-8'), 'sha256').hexdigest()
+
+def _check_proof(proof, expected):
+    import hmac
+
+    return isinstance(proof, str) and hmac.compare_digest(proof.encode('utf-8'), expected.encode('ascii'))
+
+def make_server(address):
+    """
+    Creates the resident daemon server for an address from daemon_address().
+    Each connection carries newline-delimited JSON requests such as
+    {"op": "slugify", "text": "..."} ("slugify" or "process", optionally with a
+    config "profile") and receives one
+    {"result": "..."} or {"error": "..."} line per request. Requests are served
+    by get_slugifier(), so edits to config.ini are picked up on the next request.
+
+    A TCP daemon writes a random secret to daemon_token_path(port) (mode 0600).
+    A connection starts with {"hello": NONCE}, answered with
+    {"proof": ..., "challenge": ...}; every request then carries an "auth"
+    field. Both are HMACs of the nonces under the secret, so neither side
+    talks to a process of another user that happens to hold the port.
+    """
+    import json
+    import secrets
+    import socket
+    import socketserver
+
+    class DaemonHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            token = self.server.token
+            if token is not None:
+                try:
+                    hello = json.loads(self.rfile.readline())['hello']
+                    proof = _daemon_proof(token, 'server', hello)
+                except (ValueError, KeyError, TypeError) as e:
+                    self.respond({'error': f"Bad request: {e}"})
+                    return
+                challenge = secrets.token_hex(16)
+                self.respond({'proof': proof, 'challenge': challenge})
+                expected_auth = _daemon_proof(token, 'client', challenge)
+
+            for raw in self.rfile:
+                try:
+                    request = json.loads(raw)
+                    if token is not None and not _check_proof(request.get('auth'), expected_auth):
+                        self.respond({'error': "Not authorized"})
+                        return
+                    op = request['op']
+                    text = request['text']
+                    slugifier = get_slugifier(request.get('profile'))
+                    if op == 'slugify':
+                        response = {'result': slugifier.slugify(text)}
+                    elif op == 'process':
+                        response = {'result': slugifier.process(text)}
+                    else:
+                        response = {'error': f"Unknown op: {op!r}"}
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    response = {'error': f"Bad request: {e}"}
+                self.respond(response)
+
+        def respond(self, response):
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+    if isinstance(address, tuple):
+        class DaemonServer(socketserver.ThreadingTCPServer):
+            allow_reuse_address = True
+            daemon_threads = True
+        server = DaemonServer(address, DaemonHandler)
+        # The bound port, in case port 0 picked a free one
+        server.token_path = daemon_token_path(server.server_address[1])
+        server.token = secrets.token_hex(32)
+        try:
+            _atomic_write(server.token_path, server.token, 0o600)
+        except BaseException:
+            server.server_close()
+            raise
+        return server
+
+    if os.path.exists(address):
+        # Replace a stale socket file, but never a live daemon
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(address)
+            except OSError:
+                os.unlink(address)
+            else:
+                raise OSError(f"A daemon is already listening on {address}")
+
+    class DaemonServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+        token = None
+    server = DaemonServer(address, DaemonHandler)
+    # Only the owner may send clipboard text to this daemon
+    os.chmod(address, 0o600)
+    return server
+
+def serve(address):
+    """Runs the resident daemon until interrupted."""
+    server = make_server(address)
+    print(f"zid_name daemon listening on {address}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(address, tuple):
+            if os.path.exists(server.token_path):
+                os.unlink(server.token_path)
+        elif os.path.exists(address):
+            os.unlink(address)
+
+def request_daemon(op, text, address, timeout=DAEMON_TIMEOUT, profile=None):
+    """
+    Sends one request to a running daemon and returns its result.
+    Raises OSError if no daemon is reachable (or its Unix socket belongs to
+    another user, or the process on a TCP port cannot prove it knows the
+    daemon secret) and ValueError if it rejects the request.
+    """
+    import json
+    import secrets
+    import socket
+
+    family = socket.AF_INET if isinstance(address, tuple) else socket.AF_UNIX
+    token = None
+    if family == socket.AF_INET:
+        with open(daemon_token_path(address[1]), encoding='ascii') as f:
+            token = f.read().strip()
+        if not token:
+            raise PermissionError(f"{daemon_token_path(address[1])} holds no daemon secret")
+    elif os.stat(address).st_uid != os.getuid():
+        # e.g. a /tmp socket created by another local user to receive our text
+        raise PermissionError(f"{address} is not owned by the current user")
+
+    request = {'op': op, 'text': text}
+    if profile is not None:
+        request['profile'] = profile
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(address)
+        with sock.makefile('rb') as reader:
+            if token is not None:
+                nonce = secrets.token_hex(16)
+                sock.sendall(json.dumps({'hello': nonce}).encode('utf-8') + b'\n')
+                try:
+                    reply = json.loads(reader.readline())
+                    proven = _check_proof(reply['proof'], _daemon_proof(token, 'server', nonce))
+                    request['auth'] = _daemon_proof(token, 'client', reply['challenge'])
+                except (ValueError, KeyError, TypeError):
+                    proven = False
+                if not proven:
+                    raise PermissionError(f"127.0.0.1:{address[1]} is not the zid_name daemon of the current user")
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            response = json.loads(reader.readline())
+
+    if 'error' in response:
+        raise ValueError(response['error'])
+    return response['result']
+
+def client_process_string(input_string, address, profile=None):
+    """process_string via the daemon, falling back to in-process execution if none is running."""
+    try:
+        return request_daemon('process', input_string, address, profile=profile)
+    except OSError:
+        return process_string(input_string, profile)
+
+def plan_renames(paths, slugifier, recursive=False):
+    """
+    Computes new names for files and directories without touching the disk.
+    A directory path renames its entries (and, with recursive, everything below
+    it); a file path renames that file. Names are converted like a single line
+    passed to the CLI (ZID aware, extension handling from config).
+    Each directory is listed once with os.scandir and collisions are detected
+    against that listing, so no per-file stat is needed. Hidden entries
+    (starting with '.') are left alone. Entries reached through more than one
+    argument (a directory and a file in it, overlapping recursive directories)
+    are planned only once.
+
+    Returns (renames, problems): (old_path, new_path) pairs ordered deepest path
+    first, so contents are renamed before their directory, and messages for names that cannot be
+    renamed safely.
+    """
+    renames = []
+    problems = []
+    files_by_parent = {}
+    planned = set()
+
+    for path in paths:
+        path = os.path.normpath(path)
+        if os.path.isdir(path):
+            _plan_directory(path, None, slugifier, recursive, renames, problems, planned)
+        elif os.path.lexists(path):
+            files_by_parent.setdefault(os.path.dirname(path) or os.curdir, set()).add(os.path.basename(path))
+        else:
+            problems.append(f"{path}: no such file or directory")
+
+    for parent, names in files_by_parent.items():
+        _plan_directory(parent, names, slugifier, recursive, renames, problems, planned)
+
+    # Deepest paths first: a file argument below a directory that another
+    # argument renames must be moved while its old path still exists.
+    renames.sort(key=lambda rename: os.path.abspath(rename[0]).count(os.sep), reverse=True)
+    return renames, problems
+
+def _plan_directory(directory, only_names, slugifier, recursive, renames, problems, planned):
+    with os.scandir(directory) as scanner:
+        entries = list(scanner)
+    existing = {entry.name for entry in entries}
+    targets = {}
+
+    for entry in entries:
+        name = entry.name
+        if name.startswith('.') or (only_names is not None and name not in only_names):
+            continue
+        source = os.path.abspath(entry.path)
+        if source in planned:
+            continue
+        planned.add(source)
+        if recursive and entry.is_dir(follow_symlinks=False):
+            _plan_directory(entry.path, None, slugifier, recursive, renames, problems, planned)
+        new_name = slugifier.process_line(name, force_sanitize=True)
+        if new_name != name:
+            targets.setdefault(new_name, []).append(name)
+
+    for new_name, old_names in targets.items():
+        if not new_name or new_name.startswith('.'):
+            problems.append(f"{os.path.join(directory, old_names[0])}: slug '{new_name}' is not a usable name")
+        elif len(old_names) > 1:
+            problems.append(f"{directory}: {', '.join(sorted(old_names))} would all become '{new_name}'")
+        elif new_name in existing:
+            problems.append(f"{os.path.join(directory, old_names[0])}: '{new_name}' already exists")
+        else:
+            renames.append((os.path.join(directory, old_names[0]), os.path.join(directory, new_name)))
+
+def apply_renames(renames, journal_path):
+    """
+    Performs planned renames in order, recording each one in an undo journal
+    (JSON lines) as soon as it succeeds. Raises FileNotFoundError before
+    renaming anything if a source path does not exist.
+    """
+    import json
+
+    missing = [old_path for old_path, _ in renames if not os.path.lexists(old_path)]
+    if missing:
+        raise FileNotFoundError(f"No such file or directory: {', '.join(missing)}")
+
+    with open(journal_path, 'a', encoding='utf-8') as journal:
+        for old_path, new_path in renames:
+            os.rename(old_path, new_path)
+            journal.write(json.dumps({'from': os.path.abspath(old_path), 'to': os.path.abspath(new_path)}) + "\n")
+            journal.flush()
+
+def undo_renames(journal_path):
+    """Reverts the renames recorded in an undo journal, newest first. Returns the count."""
+    import json
+
+    with open(journal_path, encoding='utf-8') as journal:
+        records = [json.loads(line) for line in journal if line.strip()]
+
+    for record in reversed(records):
+        if os.path.lexists(record['from']):
+            raise OSError(f"Cannot undo, '{record['from']}' exists again")
+        os.rename(record['to'], record['from'])
+    return len(records)
+
+def rename_main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="zid_name rename", description="Rename files and directories to their slugs.")
+    parser.add_argument("paths", nargs='*', metavar='PATH', help="Files to rename, or directories whose entries are renamed.")
+    parser.add_argument("-r", "--recursive", action='store_true', help="Also rename everything below the given directories.")
+    parser.add_argument("-n", "--dry-run", action='store_true', help="Only print the planned renames.")
+    parser.add_argument("--journal", metavar='FILE', help="Undo journal to write (default: zid-name-undo-<timestamp>.jsonl).")
+    parser.add_argument("--undo", metavar='JOURNAL', help="Revert the renames recorded in JOURNAL.")
+    parser.add_argument("--config-profile", metavar='NAME', help="Use the [profile:NAME] rules from config.ini.")
+    args = parser.parse_args(argv)
+    _check_profile(parser, args.config_profile)
+
+    if args.undo:
+        print(f"Reverted {undo_renames(args.undo)} renames.")
+        return 0
+    if not args.paths:
+        parser.error("at least one PATH is required")
+
+    renames, problems = plan_renames(args.paths, get_slugifier(args.config_profile), args.recursive)
+    for old_path, new_path in renames:
+        print(f"{old_path} -> {os.path.basename(new_path)}")
+    for problem in problems:
+        print(f"Conflict: {problem}", file=sys.stderr)
+
+    if problems:
+        print("Nothing renamed because of the conflicts above.", file=sys.stderr)
+        return 1
+    if args.dry_run or not renames:
+        return 0
+
+    journal_path = args.journal or f"zid-name-undo-{time.strftime('%Y%m%d%H%M%S')}.jsonl"
+    try:
+        apply_renames(renames, journal_path)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"Renamed {len(renames)} entries (undo journal: {journal_path}).")
+    return 0
+
+def scan_vault(vault_dir, index, slugifier):
+    """
+    One incremental normalization pass over the Markdown files of a vault.
+    index maps relative paths to (mtime_ns, size, line_digests, zids) and is updated
+    in place: files whose mtime and size are unchanged are skipped, and in changed
+    files only lines whose digest is not already known go through process_line.
+    Rewritten files are replaced atomically, unless they changed again while
+    being processed (they are picked up by the next pass). Files that cannot be
+    read as UTF-8 are reported and skipped until they change. Symlinked notes
+    are left alone, since replacing them would turn the link into a copy.
+    Returns the rewritten relative paths.
+    """
+    from hashlib import blake2b
+
+    process_line = slugifier.process_line
+    seen = set()
+    updated = []
+
+    for entry in _iter_markdown(vault_dir, follow_symlinks=False):
+        relpath = os.path.relpath(entry.path, vault_dir)
+        seen.add(relpath)
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue  # removed during the scan
+        record = index.get(relpath)
+        if record is not None and record[0] == stat.st_mtime_ns and record[1] == stat.st_size:
+            continue
+
+        known = set()
+        if record is not None:
+            known = {record[2][i:i + 8] for i in range(0, len(record[2]), 8)}
+
+        try:
+            with open(entry.path, encoding='utf-8', newline='') as f:
+                lines = f.readlines()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Skipped {relpath}: {e}", file=sys.stderr)
+            index[relpath] = (stat.st_mtime_ns, stat.st_size, b"", ())
+            continue
+
+        digests = set()
+        zids = []
+        changed = False
+        for i, line in enumerate(lines):
+            text, ending = split_line_ending(line)
+            digest = blake2b(text.encode('utf-8'), digest_size=8).digest()
+            if digest not in known:
+                new_text = process_line(text)
+                if new_text != text:
+                    lines[i] = new_text + ending
+                    text = new_text
+                    digest = blake2b(text.encode('utf-8'), digest_size=8).digest()
+                    changed = True
+            digests.add(digest)
+            zid_match = zidStartRegex.match(text)
+            if zid_match:
+                zids.append(int(zid_match.group(1)))
+
+        if changed:
+            try:
+                replaced = _atomic_write(entry.path, "".join(lines), stat.st_mode,
+                                         expected=(stat.st_mtime_ns, stat.st_size))
+            except OSError as e:
+                print(f"Skipped {relpath}: {e}", file=sys.stderr)
+                continue
+            if not replaced:
+                continue  # edited since it was read; the next pass sees the new version
+            stat = os.stat(entry.path)
+            updated.append(relpath)
+        index[relpath] = (stat.st_mtime_ns, stat.st_size, b"".join(sorted(digests)), tuple(zids))
+
+    for relpath in [relpath for relpath in index if relpath not in seen]:
+        del index[relpath]
+    return updated
+
+def _iter_markdown(directory, follow_symlinks=True):
+    # Symlinked directories are never descended into; symlinked notes are
+    # skipped with follow_symlinks=False (os.replace would replace the link).
+    with os.scandir(directory) as scanner:
+        for entry in scanner:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_markdown(entry.path, follow_symlinks)
+            elif entry.name.endswith('.md') and entry.is_file(follow_symlinks=follow_symlinks):
+                yield entry
+
+def _atomic_write(path, data, mode=None, expected=None):
+    """
+    Writes str or bytes to path via a temporary file and os.replace.
+    With expected=(mtime_ns, size), path is only replaced if its stat still
+    matches; returns False (leaving path alone) otherwise.
+    """
+    import tempfile
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or os.curdir, prefix='.zid-name-')
+    try:
+        if isinstance(data, str):
+            with open(fd, 'w', encoding='utf-8', newline='') as f:
+                f.write(data)
+        else:
+            with open(fd, 'wb') as f:
+                f.write(data)
+        if mode is not None:
+            os.chmod(tmp_path, mode & 0o7777)
+        if expected is not None:
+            current = os.stat(path)
+            if (current.st_mtime_ns, current.st_size) != expected:
+                os.unlink(tmp_path)
+                return False
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+def load_vault_index(path, slugifier):
+    """Loads a watch index, or returns an empty one if missing, outdated or built with other settings."""
+    import marshal
+
+    try:
+        with open(path, 'rb') as f:
+            data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != WATCH_INDEX_VERSION \
+            or data.get('fingerprint') != slugifier.fingerprint:
+        return {}
+    return data['files']
+
+def save_vault_index(path, index, slugifier):
+    import marshal
+
+    data = {'version': WATCH_INDEX_VERSION, 'fingerprint': slugifier.fingerprint, 'files': index}
+    _atomic_write(path, marshal.dumps(data))
+
+def watch_main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="zid_name watch",
+                                     description="Keep ZID lines in a Markdown vault normalized as files change.")
+    parser.add_argument("vault", metavar='VAULT_DIR', help="Vault directory to watch.")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL, help=f"Seconds between scans (default: {WATCH_INTERVAL}).")
+    parser.add_argument("--once", action='store_true', help="Run a single pass and exit.")
+    parser.add_argument("--index", metavar='FILE', help=f"Index file (default: VAULT_DIR/{WATCH_INDEX_NAME}).")
+    parser.add_argument("--config-profile", metavar='NAME', help="Use the [profile:NAME] rules from config.ini.")
+    args = parser.parse_args(argv)
+    _check_profile(parser, args.config_profile)
+
+    index_path = args.index or os.path.join(args.vault, WATCH_INDEX_NAME)
+    slugifier = get_slugifier(args.config_profile)
+    index = load_vault_index(index_path, slugifier)
+
+    try:
+        while True:
+            current = get_slugifier(args.config_profile)
+            if current.fingerprint != slugifier.fingerprint:
+                # config.ini changed: every line has to be checked again
+                slugifier, index = current, {}
+
+            before = dict(index)
+            for relpath in scan_vault(args.vault, index, slugifier):
+                print(f"Updated {relpath}")
+            if index != before:
+                save_vault_index(index_path, index, slugifier)
+
+            if args.once:
+                return 0
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+class ZidIndex:
+    """
+    Index of (zid, slug, path, line) records for fast "who owns ZID X" lookups,
+    duplicate reports and creation-time range queries. ZIDs are kept as a sorted
+    array of 64-bit integers (memory-mapped when loaded from disk), so lookups
+    and range scans are O(log n) binary searches. Line 0 refers to the file name.
+    """
+
+    def __init__(self):
+        from array import array
+
+        self.zids = array('Q')
+        self._records = []
+        self._pending = []
+        self._records_loader = None
+        self._mmap = None
+
+    def __len__(self):
+        self._sort()
+        return len(self.zids)
+
+    def add(self, zid, slug, path, line):
+        self._pending.append((int(zid), slug, path, line))
+
+    def collect(self, lines, path, separator='-'):
+        """
+        Passes processed lines through unchanged while recording their ZIDs,
+        e.g. index.collect(slugifier.process_stream(source), path).
+        """
+        for number, line in enumerate(lines, 1):
+            zid_match = zidStartRegex.match(line)
+            if zid_match:
+                slug = line[zid_match.end():].strip().lstrip(separator)
+                self.add(zid_match.group(1), slug, path, number)
+            yield line
+
+    def add_file(self, path, slugifier):
+        """Records the ZIDs of a Markdown file: its name (line 0) and its processed lines."""
+        name = os.path.basename(path)
+        zid_match = zidStartRegex.match(name)
+        if zid_match:
+            stem = os.path.splitext(name[zid_match.end():])[0]
+            self.add(zid_match.group(1), slugifier.slugify(stem).lstrip(slugifier.separator), path, 0)
+        with open(path, encoding='utf-8', newline='') as f:
+            for _ in self.collect(slugifier.process_stream(f), path, slugifier.separator):
+                pass
+
+    @property
+    def records(self):
+        if self._records_loader is not None:
+            self._records = self._records_loader()
+            self._records_loader = None
+        return self._records
+
+    def _sort(self):
+        if not self._pending:
+            return
+        from array import array
+
+        entries = sorted(list(zip(self.zids, self.records)) +
+                         [(zid, (slug, path, line)) for zid, slug, path, line in self._pending],
+                         key=lambda entry: (entry[0], entry[1][1], entry[1][2]))
+        self._pending = []
+        self._release()
+        self.zids = array('Q', [zid for zid, _ in entries])
+        self._records = [record for _, record in entries]
+
+    def _entries(self, start, end):
+        records = self.records
+        return [(self.zids[i], *records[i]) for i in range(start, end)]
+
+    def lookup(self, zid):
+        """Returns all records for a ZID (more than one means it is duplicated)."""
+        return self.range(zid, zid)
+
+    def range(self, first, last):
+        """Returns the records with first <= zid <= last, in ZID order."""
+        from bisect import bisect_left, bisect_right
+
+        self._sort()
+        return self._entries(bisect_left(self.zids, int(first)), bisect_right(self.zids, int(last)))
+
+    def duplicates(self):
+        """
+        Returns {zid: [records]} for every ZID owned by more than one file.
+        Records within one file (e.g. its name and its "# ZID Title" heading)
+        are the same note and do not count as duplicates.
+        """
+        self._sort()
+        zids = self.zids
+        records = self.records
+        result = {}
+        start = 0
+        for i in range(1, len(zids) + 1):
+            if i == len(zids) or zids[i] != zids[start]:
+                if i - start > 1 and len({records[j][1] for j in range(start, i)}) > 1:
+                    result[zids[start]] = self._entries(start, i)
+                start = i
+        return result
+
+    def save(self, path):
+        import marshal
+
+        self._sort()
+        zids = self.zids
+        if sys.byteorder != 'little':
+            zids = type(zids)(zids)
+            zids.byteswap()
+        records = marshal.dumps(self.records)
+        count = len(zids)
+        header = ZID_INDEX_MAGIC + count.to_bytes(8, 'little') + (24 + 8 * count).to_bytes(8, 'little')
+        _atomic_write(path, header + zids.tobytes() + records)
+
+    @classmethod
+    def load(cls, path):
+        """Opens an index file; the ZID array is memory-mapped, records are read on first use."""
+        import marshal
+        import mmap
+
+        index = cls()
+        with open(path, 'rb') as f:
+            if f.read(8) != ZID_INDEX_MAGIC:
+                raise ValueError(f"{path} is not a ZID index file")
+            count = int.from_bytes(f.read(8), 'little')
+            records_offset = int.from_bytes(f.read(8), 'little')
+            if count == 0:
+                return index
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapped)
+        if sys.byteorder == 'little':
+            index._mmap = mapped
+            index.zids = view[24:records_offset].cast('Q')
+        else:
+            index.zids.frombytes(view[24:records_offset])
+            index.zids.byteswap()
+        index._records_loader = lambda: marshal.loads(view[records_offset:])
+        return index
+
+    def _release(self):
+        if self._mmap is not None:
+            self.zids.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self):
+        self.records  # load records before unmapping
+        self._release()
+        from array import array
+        self.zids = array('Q')
+
+def build_zid_index(paths, slugifier):
+    """Builds a ZidIndex from Markdown files and directories (scanned recursively)."""
+    index = ZidIndex()
+    for path in paths:
+        if os.path.isdir(path):
+            for entry in _iter_markdown(path):
+                index.add_file(entry.path, slugifier)
+        else:
+            index.add_file(path, slugifier)
+    return index
+
+def _parse_zid_bound(value, fill):
+    """Expands a ZID prefix such as '2026' or '20260105' to a full 14-digit bound."""
+    if not value.isdigit() or len(value) > 14:
+        raise ValueError(f"Not a ZID or ZID prefix: {value!r}")
+    return int(value.ljust(14, fill))
+
+def index_main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="zid_name index", description="Build and query an index of ZIDs.")
+    parser.add_argument("--index", default=ZID_INDEX_FILE, metavar='FILE', help=f"Index file (default: {ZID_INDEX_FILE}).")
+    actions = parser.add_subparsers(dest='action', required=True)
+    build = actions.add_parser('build', help="Index the ZIDs of Markdown files and directories.")
+    build.add_argument("paths", nargs='+', metavar='PATH')
+    query = actions.add_parser('query', help="Look up a ZID, or all ZIDs in a range (prefixes allowed).")
+    query.add_argument("zid", nargs='?')
+    query.add_argument("--from", dest='first', metavar='ZID')
+    query.add_argument("--to", dest='last', metavar='ZID')
+    actions.add_parser('dupes', help="Report ZIDs that occur more than once.")
+    args = parser.parse_args(argv)
+
+    def print_records(records):
+        for zid, slug, path, line in records:
+            print(f"{zid}\t{path}:{line}\t{slug}")
+
+    if args.action == 'query':
+        try:
+            if args.zid is not None:
+                first, last = _parse_zid_bound(args.zid, '0'), _parse_zid_bound(args.zid, '9')
+            elif args.first or args.last:
+                first = _parse_zid_bound(args.first or '0', '0')
+                last = _parse_zid_bound(args.last or '9', '9')
+            else:
+                parser.error("query needs a ZID or --from/--to")
+        except ValueError as e:
+            parser.error(str(e))
+
+    try:
+        if args.action == 'build':
+            index = build_zid_index(args.paths, get_slugifier())
+            index.save(args.index)
+            print(f"Indexed {len(index)} ZIDs into {args.index}.")
+            return 0
+        index = ZidIndex.load(args.index)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        if args.action == 'query':
+            records = index.range(first, last)
+            print_records(records)
+            return 0 if records else 1
+
+        duplicates = index.duplicates()
+        for records in duplicates.values():
+            print_records(records)
+        return 1 if duplicates else 0
+    finally:
+        index.close()
+
+def config_main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="zid_name config", description="Manage the config.ini snapshot.")
+    actions = parser.add_subparsers(dest='action', required=True)
+    actions.add_parser('compile', help="Validate config.ini and write a snapshot that later runs load without parsing.")
+    actions.add_parser('check', help="Report whether the snapshot is up to date (exit status 1 if not).")
+    args = parser.parse_args(argv)
+
+    snapshot_path = config_snapshot_path(CONFIG_PATH)
+    if args.action == 'compile':
+        try:
+            snapshot_path, source_hash = compile_config_snapshot(CONFIG_PATH)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(f"Compiled {CONFIG_PATH} into {snapshot_path} (hash {source_hash}).")
+        return 0
+
+    if load_config_snapshot(CONFIG_PATH) is not None:
+        print(f"{snapshot_path} is up to date.")
+        return 0
+    if os.path.exists(snapshot_path):
+        print(f"{snapshot_path} is outdated; {CONFIG_PATH} is parsed instead. Run 'zid_name config compile'.")
+    else:
+        print(f"No snapshot; {CONFIG_PATH} is parsed on every start. Run 'zid_name config compile'.")
+    return 1
+
+def _report_timings(timings):
+    parts = []
+    if _clipboard is not None:
+        parts.append(f"clipboard={_clipboard.name}")
+    for step, seconds, chars in timings:
+        duration = "" if seconds is None else f"={seconds * 1000:.2f}ms"
+        parts.append(f"{step}{duration} ({chars} chars)")
+    print("Debug: " + ", ".join(parts), file=sys.stderr)
+
+def _check_profile(parser, name):
+    if name is not None and name not in get_profiles():
+        available = ", ".join(sorted(get_profiles())) or "none defined"
+        parser.error(f"unknown config profile {name!r} (available: {available})")
+
+def _report_cache():
+    info = cache_info()
+    if info is not None:
+        print("Cache: " + ", ".join(f"{key}={value}" for key, value in info.items()), file=sys.stderr)
+
+def _report_profile(output_format):
+    if _slug_stats is not None:
+        print(_slug_stats.to_json() if output_format == 'json' else _slug_stats.summary(), file=sys.stderr)
+
+def main(argv=None):
+    import argparse
+    import atexit
+
+    argv = sys.argv[1:] if argv is None else argv
+    commands = {'rename': rename_main, 'watch': watch_main, 'index': index_main, 'config': config_main}
+    if argv and argv[0] in commands:
+        sys.exit(commands[argv[0]](argv[1:]))
+
+    parser = argparse.ArgumentParser(
+        description="Process string for a filename based on config.ini settings (ZID aware).",
+        epilog="commands:\n"
+               "  rename PATH...    rename files and directories to their slugs (see 'rename --help')\n"
+               "  watch VAULT_DIR   keep ZID lines in a Markdown vault normalized (see 'watch --help')\n"
+               "  index ACTION      build/query/dupes over an index of ZIDs (see 'index --help')\n"
+               "  config ACTION     compile/check the config.ini snapshot (see 'config --help')",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
     parser.add_argument("input_string", nargs='?', type=str, help="Input string to process. If not provided, clipboard content will be used.")
-    args = parser.parse_args()
-    
-    input_text = args.input_string if args.input_string is not None else get_clipboard_text()
-    
-    output_string = process_string(input_text)
-    
-    set_clipboard_text(output_string)
+    parser.add_argument("--stdin", action='store_true', help="Stream lines from standard input (batch mode, clipboard is not used).")
+    parser.add_argument("--input", metavar='FILE', help="Stream lines from FILE (batch mode, clipboard is not used).")
+    parser.add_argument("--output", metavar='FILE', help="Write the result to FILE instead of the clipboard/standard output.")
+    parser.add_argument("--no-clipboard", action='store_true', help="Never read or write the clipboard; only print the result.")
+    parser.add_argument("--debug", action='store_true', help="Report the clipboard backend and read/process/write timings on stderr.")
+    parser.add_argument("--jobs", type=int, default=1, metavar='N', help="Worker processes for --stdin/--input (0 = one per CPU, default: 1).")
+    parser.add_argument("--unique", action='store_true', help="With --stdin/--input, number repeated slugs (note, note-2, note-3) instead of emitting duplicates.")
+    parser.add_argument("--unique-against", metavar='DIR', help="Like --unique, also avoiding the names already in DIR.")
+    parser.add_argument("--cache-size", type=int, metavar='N', help="Cache up to N slugified titles (reports cache statistics on stderr).")
+    parser.add_argument("--config-profile", metavar='NAME', help="Use the [profile:NAME] rules from config.ini.")
+    parser.add_argument("--profile", action='store_true', help="Report per-stage timings and line/byte counters on stderr.")
+    parser.add_argument("--profile-format", choices=('text', 'json'), default='text', help="Format of the --profile report (default: text).")
+    parser.add_argument("--serve", action='store_true', help="Run as a resident daemon answering --client requests.")
+    parser.add_argument("--client", action='store_true', help="Process via a running daemon (falls back to in-process execution).")
+    parser.add_argument("--socket", metavar='PATH', help="Unix socket path of the daemon.")
+    parser.add_argument("--port", type=int, metavar='N', help="Use localhost TCP port N for the daemon instead of a Unix socket "
+                        "(authenticated with a per-user secret file, see README).")
+    args = parser.parse_args(argv)
+    _check_profile(parser, args.config_profile)
+
+    if args.cache_size is not None:
+        enable_cache(max_entries=args.cache_size)
+        atexit.register(_report_cache)
+
+    if args.profile:
+        enable_profiling()
+        atexit.register(_report_profile, args.profile_format)
+
+    if args.serve:
+        serve(daemon_address(args.socket, args.port))
+        return
+
+    if args.stdin or args.input is not None:
+        if args.input_string is not None or (args.stdin and args.input is not None):
+            parser.error("use only one of input_string, --stdin and --input")
+        # Worker processes keep their own counters, so profiling runs in-process
+        jobs = 1 if args.profile else args.jobs or None
+        run_stream('-' if args.stdin else args.input, args.output or '-', jobs, args.config_profile,
+                   args.unique, args.unique_against)
+        return
+
+    if args.unique or args.unique_against is not None:
+        parser.error("--unique and --unique-against require --stdin or --input")
+
+    if args.input_string is None and args.no_clipboard:
+        parser.error("input_string is required with --no-clipboard")
+
+    clock = time.perf_counter
+    timings = []
+    if args.input_string is None:
+        start = clock()
+        try:
+            input_text = get_clipboard_text()
+        except OSError as e:
+            sys.exit(f"Error: cannot read the clipboard: {e}")
+        timings.append(('read', clock() - start, len(input_text)))
+    else:
+        input_text = args.input_string
+
+    start = clock()
+    if args.client:
+        output_string = client_process_string(input_text, daemon_address(args.socket, args.port), args.config_profile)
+    else:
+        output_string = process_string(input_text, args.config_profile)
+    timings.append(('process', clock() - start, len(input_text)))
+
+    if args.output is not None:
+        with open_text(args.output, 'w') as target:
+            target.write(output_string)
+    elif not args.no_clipboard:
+        if args.input_string is None and output_string == input_text:
+            # Nothing changed: skip the write and its round-trip to the clipboard tool
+            timings.append(('write skipped', None, len(output_string)))
+        else:
+            start = clock()
+            set_clipboard_text(output_string)
+            timings.append(('write', clock() - start, len(output_string)))
+
+    if args.debug:
+        _report_timings(timings)
 
-    print(output_string)
+    if args.output is None:
+        print(output_string)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()